@@ -1,10 +1,15 @@
 import streamlit as st
 import pandas as pd
+import os
 
 from services.book_service import BookService
 from services.student_service import StudentService
 from services.user_service import UserService
-from database.db import initialize_database
+from services.job_service import JobService
+from services.export_service import ExportService, EXPORT_FORMATS, get_export_formats
+from database.db import initialize_database, get_table_generation
+from config import get_config
+from utils.metrics import get_registry, timed
 
 st.set_page_config(
     page_title="AI-ML Assignment",
@@ -18,9 +23,141 @@ def get_services():
     return {
         'books': BookService(),
         'students': StudentService(),
-        'users': UserService()
+        'users': UserService(),
+        'jobs': JobService(),
+        'exports': ExportService()
     }
 
+@st.cache_data(show_spinner=False, ttl=get_config().cache_ttl)
+def cached_read(_service, table, generation, method, *args, **kwargs):
+    return getattr(_service, method)(*args, **kwargs)
+
+def read_table(service, table, method, *args, **kwargs):
+    return cached_read(service, table, get_table_generation(table), method, *args, **kwargs)
+
+def get_page_cursor(key):
+    return st.session_state.setdefault(f"{key}_cursors", [None])[-1]
+
+def reset_pager(key):
+    st.session_state[f"{key}_cursors"] = [None]
+
+def render_pager(key, page):
+    cursors = st.session_state.setdefault(f"{key}_cursors", [None])
+    
+    col1, col2, col3 = st.columns([1, 2, 1])
+    
+    with col1:
+        if st.button("◀ Previous", key=f"{key}_prev", disabled=len(cursors) == 1,
+                     use_container_width=True):
+            cursors.pop()
+            st.rerun()
+    
+    with col2:
+        st.caption(f"Page {len(cursors)}")
+    
+    with col3:
+        if st.button("Next ▶", key=f"{key}_next", disabled=page['next_cursor'] is None,
+                     use_container_width=True):
+            cursors.append(page['next_cursor'])
+            st.rerun()
+
+def start_job(key, job_id):
+    st.session_state[f"{key}_job"] = job_id
+    st.rerun()
+
+def job_running(key):
+    return f"{key}_job" in st.session_state
+
+def pop_finished_job(key):
+    return st.session_state.pop(f"{key}_finished", None)
+
+@st.fragment(run_every=get_config().jobs.poll_interval)
+def render_job_progress(job_service, key):
+    job_id = st.session_state.get(f"{key}_job")
+    if job_id is None:
+        return
+    
+    job = job_service.get_job(job_id)
+    if job is None or not job['active']:
+        st.session_state.pop(f"{key}_job", None)
+        st.session_state[f"{key}_finished"] = job
+        st.rerun()
+    
+    label = job['message'] or f"Job #{job_id} is {job['status']}..."
+    
+    if job['progress_total']:
+        st.progress(min(job['progress_current'] / job['progress_total'], 1.0), text=label)
+    else:
+        st.info(f"⏳ {label}")
+    
+    if job['cancellable'] and not job['cancel_requested'] and st.button("⏹️ Cancel", key=f"{key}_cancel"):
+        job['cancel_requested'] = job_service.cancel(job_id)
+    
+    if job['cancel_requested']:
+        st.caption("Cancelling...")
+
+def render_job_history(job_service):
+    jobs = job_service.list_jobs(limit=10)
+    if not jobs:
+        return
+    
+    with st.sidebar.expander("Background Jobs"):
+        df = pd.DataFrame(jobs, columns=['id', 'kind', 'status', 'progress_current', 'created_at'])
+        df.columns = ['ID', 'Kind', 'Status', 'Progress', 'Created At']
+        st.dataframe(df, use_container_width=True, hide_index=True)
+
+def discard_export(key):
+    export = st.session_state.pop(key, None)
+    if export and export['success'] and os.path.exists(export['path']):
+        os.remove(export['path'])
+
+def render_export(table):
+    export_service = get_services()['exports']
+    state_key = f"{table}_export"
+    
+    col1, col2, col3 = st.columns([1, 1, 2])
+    
+    with col1:
+        fmt = st.selectbox("Export format", get_export_formats(), key=f"{table}_export_format",
+                           label_visibility="collapsed")
+    
+    with col2:
+        if st.button("📦 Prepare Export", key=f"{table}_export_prepare"):
+            discard_export(state_key)
+            max_bytes = get_config().exports.download_max_mb * 1024 * 1024
+            with st.spinner(f"Exporting {table}..."):
+                st.session_state[state_key] = export_service.export_to_tempfile(table, fmt, max_bytes=max_bytes)
+    
+    export = st.session_state.get(state_key)
+    if export is None:
+        return
+    
+    if export['too_large']:
+        st.warning(
+            f"{table.title()} is larger than {get_config().exports.download_max_mb}MB as {export['format']}. "
+            f"Export it from the command line instead: "
+            f"`python -m services.export_service {table} -o {table}.{export['format']}`"
+        )
+        return
+    
+    if not export['success']:
+        st.error(f"Export failed: {export['error']}")
+        return
+    
+    if not os.path.exists(export['path']):
+        st.session_state.pop(state_key)
+        return
+    
+    with col3:
+        with open(export['path'], 'rb') as f:
+            st.download_button(
+                label=f"⬇️ Download {table}.{export['format']} ({export['rows']} rows)",
+                data=f,
+                file_name=f"{table}.{export['format']}",
+                mime=EXPORT_FORMATS[export['format']],
+                key=f"{table}_export_download"
+            )
+
 def render_sidebar():
     st.sidebar.title("Navigation")
     st.sidebar.markdown("---")
@@ -41,7 +178,7 @@ def render_sidebar():
     
     return option
 
-def render_books_module(book_service):
+def render_books_module(book_service, job_service):
     st.header("📚 Books API Module")
     st.write("Fetch books from Open Library API and store in SQLite database")
     
@@ -55,10 +192,13 @@ def render_books_module(book_service):
     with col2:
         limit = st.number_input("Max Results", min_value=1, max_value=50, value=10)
     
+    fetch_all = st.checkbox("Fetch all matching results (paged)")
+    
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        fetch_btn = st.button("🔄 Fetch Books", type="primary", use_container_width=True)
+        fetch_btn = st.button("🔄 Fetch Books", type="primary", use_container_width=True,
+                              disabled=job_running("books"))
     
     with col2:
         refresh_btn = st.button("📖 Show Stored Books", use_container_width=True)
@@ -69,45 +209,54 @@ def render_books_module(book_service):
     st.markdown("---")
     
     if fetch_btn:
-        with st.spinner(f"Fetching books for '{search_query}'..."):
-            try:
-                result = book_service.fetch_and_store_books(search_query, limit)
-                
-                if result['success']:
-                    st.success(f"Fetched {result['fetched']} books and saved {result['saved']} to database!")
-                else:
-                    st.error(f"Error: {result['error']}")
-            except Exception as e:
-                st.error(f"Failed to fetch books: {e}")
+        start_job("books", job_service.submit('fetch_books', {
+            'query': search_query,
+            'limit': limit,
+            'fetch_all': fetch_all
+        }))
+    
+    job = pop_finished_job("books")
+    if job:
+        result = job['result'] or {}
+        reset_pager("books")
+        
+        if job['status'] == 'succeeded':
+            st.success(f"Fetched {result['fetched']} books and saved {result['saved']} to database!")
+        elif job['status'] == 'cancelled':
+            st.warning(f"Fetch cancelled after saving {result.get('saved', 0)} books")
+        else:
+            st.error(f"Failed to fetch books: {job['error']}")
+    
+    render_job_progress(job_service, "books")
     
     if clear_btn:
         deleted = book_service.clear_books()
+        reset_pager("books")
         st.info(f"Cleared {deleted} books from database")
     
     st.subheader("Stored Books")
     
-    books = book_service.get_books_from_db()
+    stats = read_table(book_service, 'books', 'get_book_statistics')
     
-    if books:
+    if stats['total_books']:
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("Total Books", len(books))
+            st.metric("Total Books", stats['total_books'])
         with col2:
-            authors = len(set(b['author'] for b in books))
-            st.metric("Unique Authors", authors)
+            st.metric("Unique Authors", stats['unique_authors'])
         with col3:
-            years = [b['publication_year'] for b in books if b['publication_year']]
-            avg_year = int(sum(years) / len(years)) if years else 'N/A'
-            st.metric("Avg. Publication Year", avg_year)
+            st.metric("Avg. Publication Year", stats['average_year'] or 'N/A')
         
-        df = pd.DataFrame(books)
-        df = df[['title', 'author', 'publication_year', 'isbn']]
+        page = read_table(book_service, 'books', 'get_books_page', cursor=get_page_cursor("books"))
+        df = pd.DataFrame(page['items'], columns=['title', 'author', 'publication_year', 'isbn'])
         df.columns = ['Title', 'Author', 'Year', 'ISBN']
         st.dataframe(df, use_container_width=True, hide_index=True)
+        render_pager("books", page)
+        render_export('books')
     else:
         st.info("No books in database. Click 'Fetch Books' to get started!")
 
-def render_student_module(student_service):
+def render_student_module(student_service, job_service):
     st.header("📊 Student Scores Module")
     st.write("Fetch student test scores, calculate statistics, and visualize with charts")
     
@@ -116,7 +265,8 @@ def render_student_module(student_service):
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        fetch_btn = st.button("🔄 Generate Scores", type="primary", use_container_width=True)
+        fetch_btn = st.button("🔄 Generate Scores", type="primary", use_container_width=True,
+                              disabled=job_running("students"))
     
     with col2:
         refresh_btn = st.button("📊 Refresh Data", use_container_width=True)
@@ -127,29 +277,38 @@ def render_student_module(student_service):
     st.markdown("---")
     
     if fetch_btn:
-        with st.spinner("Generating student score data..."):
-            result = student_service.fetch_and_store_data()
-            
-            if result['success']:
-                st.success(
-                    f"Generated {result['fetched']} records, "
-                    f"saved {result['saved']} to database. "
-                    f"Average score: {result['average_score']}"
-                )
-            else:
-                st.error(f"Error: {result['error']}")
+        start_job("students", job_service.submit('generate_students'))
+    
+    job = pop_finished_job("students")
+    if job:
+        result = job['result'] or {}
+        reset_pager("students")
+        
+        if job['status'] == 'succeeded':
+            st.success(
+                f"Generated {result['fetched']} records, "
+                f"saved {result['saved']} to database. "
+                f"Average score: {result['average_score']}"
+            )
+        else:
+            st.error(f"Error: {job['error']}")
+    
+    render_job_progress(job_service, "students")
     
     if clear_btn:
         deleted = student_service.clear_students()
+        reset_pager("students")
         st.info(f"Cleared {deleted} student records")
     
-    students = student_service.get_student_data()
+    snapshot = read_table(
+        student_service, 'students', 'get_dashboard_snapshot', cursor=get_page_cursor("students")
+    )
     
-    if not students:
+    if not snapshot['stats']['total_records']:
         st.info("No student data. Click 'Generate Scores' to create sample data!")
         return
     
-    stats = student_service.calculate_statistics()
+    stats = snapshot['stats']
     
     st.subheader("Statistics Overview")
     
@@ -179,7 +338,7 @@ def render_student_module(student_service):
     
     with col1:
         st.write("**Average Score by Subject**")
-        subject_scores = student_service.get_scores_by_subject()
+        subject_scores = snapshot['by_subject']
         if subject_scores:
             df_subjects = pd.DataFrame({
                 'Subject': list(subject_scores.keys()),
@@ -189,7 +348,7 @@ def render_student_module(student_service):
     
     with col2:
         st.write("**Top Performers**")
-        top_performers = student_service.get_top_performers(5)
+        top_performers = snapshot['top_performers']
         if top_performers:
             df_top = pd.DataFrame(top_performers)
             df_top.columns = ['Student', 'Avg Score', 'Subjects']
@@ -198,7 +357,7 @@ def render_student_module(student_service):
     st.markdown("---")
     
     st.subheader("Scores by Student")
-    student_scores = student_service.get_scores_by_student()
+    student_scores = snapshot['by_student']
     if student_scores:
         df_students = pd.DataFrame({
             'Student': list(student_scores.keys()),
@@ -206,13 +365,76 @@ def render_student_module(student_service):
         })
         st.dataframe(df_students, use_container_width=True, hide_index=True)
     
+    st.markdown("---")
+    
+    render_score_analytics(student_service)
+    
     with st.expander("View All Records"):
-        df = pd.DataFrame(students)
-        df = df[['name', 'subject', 'score']]
+        page = snapshot['records']
+        df = pd.DataFrame(page['items'], columns=['name', 'subject', 'score'])
         df.columns = ['Name', 'Subject', 'Score']
         st.dataframe(df, use_container_width=True, hide_index=True)
+        render_pager("students", page)
+    
+    render_export('students')
+
+def render_score_analytics(student_service):
+    analytics = read_table(student_service, 'students', 'get_score_analytics')
+    if not analytics:
+        return
+    
+    st.subheader("Score Distribution")
+    
+    percentiles = analytics['percentiles']
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Median", f"{analytics['median']:.2f}%")
+    with col2:
+        st.metric("Std. Deviation", f"{analytics['std_dev']:.2f}")
+    with col3:
+        st.metric("25th / 75th Percentile", f"{percentiles[25]:.1f} / {percentiles[75]:.1f}")
+    with col4:
+        st.metric("90th Percentile", f"{percentiles[90]:.1f}%")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.write("**Score Histogram**")
+        edges = analytics['histogram']['edges']
+        df_hist = pd.DataFrame({
+            'Score Range': [f"{edges[i]:.0f}-{edges[i + 1]:.0f}" for i in range(len(edges) - 1)],
+            'Records': analytics['histogram']['counts']
+        })
+        st.bar_chart(df_hist.set_index('Score Range'))
+    
+    with col2:
+        st.write("**Z-Score Distribution (within subject)**")
+        edges = analytics['z_histogram']['edges']
+        df_z = pd.DataFrame({
+            'Z-Score': [f"{edges[i]:+.1f}" for i in range(len(edges) - 1)],
+            'Records': analytics['z_histogram']['counts']
+        })
+        st.bar_chart(df_z.set_index('Z-Score'))
+    
+    subjects = analytics['subjects']
+    df_subjects = pd.DataFrame({
+        'Subject': subjects['names'],
+        'Records': subjects['count'],
+        'Mean': subjects['mean'].round(2),
+        'Std. Deviation': subjects['std_dev'].round(2)
+    })
+    st.dataframe(df_subjects, use_container_width=True, hide_index=True)
+    
+    st.write("**Student × Subject Average Scores**")
+    pivot = analytics['pivot']
+    df_pivot = pd.DataFrame(pivot['matrix'], index=pivot['students'], columns=pivot['subjects'])
+    st.dataframe(
+        df_pivot.style.format("{:.1f}", na_rep="-").background_gradient(cmap='RdYlGn', vmin=0, vmax=100),
+        use_container_width=True
+    )
 
-def render_csv_module(user_service):
+def render_csv_module(user_service, job_service):
     st.header("👥 CSV Import Module")
     st.write("Upload a CSV file with user information and import into SQLite database")
     
@@ -241,7 +463,7 @@ def render_csv_module(user_service):
     
     with col1:
         import_btn = st.button("📥 Import Users", type="primary", use_container_width=True, 
-                               disabled=(uploaded_file is None))
+                               disabled=(uploaded_file is None or job_running("users")))
     
     with col2:
         clear_btn = st.button("🗑️ Clear All Users", use_container_width=True)
@@ -249,35 +471,57 @@ def render_csv_module(user_service):
     st.markdown("---")
     
     if uploaded_file is not None and import_btn:
-        with st.spinner("Importing users..."):
-            file_content = uploaded_file.getvalue()
-            result = user_service.import_from_upload(file_content, uploaded_file.name)
-            
-            if result['success']:
-                st.success(
-                    f"Import complete! "
-                    f"Imported: {result['imported']}, "
-                    f"Skipped: {result['skipped']}"
-                )
-                
-                if result['errors']:
-                    with st.expander("Import Warnings"):
-                        for error in result['errors']:
-                            st.warning(error)
+        start_job("users", job_service.submit_upload(uploaded_file))
+    
+    job = pop_finished_job("users")
+    if job:
+        result = job['result'] or {}
+        reset_pager("users")
+        
+        if job['status'] in ('succeeded', 'cancelled'):
+            summary = (
+                f"Imported: {result['imported']}, "
+                f"Skipped: {result['skipped']}, "
+                f"Rejected: {result['rejected']}"
+            )
+            if job['status'] == 'cancelled':
+                st.warning(f"Import cancelled after {result['total_rows']} rows. {summary}")
             else:
-                st.error(f"Import failed: {result['error']}")
+                st.success(f"Import complete! {summary}")
+            
+            if result['errors']:
+                with st.expander("Import Warnings"):
+                    for error in result['errors']:
+                        st.warning(error)
+            
+            report_path = result['rejection_report']
+            if report_path and os.path.exists(report_path):
+                max_mb = get_config().imports.reject_download_max_mb
+                if os.path.getsize(report_path) > max_mb * 1024 * 1024:
+                    st.info(f"Rejected rows report is larger than {max_mb}MB, open it on the server: {report_path}")
+                else:
+                    with open(report_path, 'rb') as report_file:
+                        st.download_button(
+                            label=f"Download Rejected Rows ({result['rejected']})",
+                            data=report_file,
+                            file_name=os.path.basename(report_path),
+                            mime="text/csv" if report_path.endswith('.csv') else "application/x-ndjson"
+                        )
+        else:
+            st.error(f"Import failed: {job['error']}")
+    
+    render_job_progress(job_service, "users")
     
     if clear_btn:
         deleted = user_service.clear_users()
+        reset_pager("users")
         st.info(f"Cleared {deleted} users from database")
     
     st.subheader("Stored Users")
     
-    users = user_service.get_all_users()
+    stats = read_table(user_service, 'users', 'get_statistics')
     
-    if users:
-        stats = user_service.get_statistics()
-        
+    if stats['total_users']:
         col1, col2, col3 = st.columns(3)
         
         with col1:
@@ -289,15 +533,24 @@ def render_csv_module(user_service):
         
         search_term = st.text_input("Search users by name or email")
         
+        columns = ['name', 'email', 'phone', 'created_at']
+        
         if search_term:
-            users = user_service.search_users(search_term)
+            users = read_table(user_service, 'users', 'search_users', search_term)
             st.info(f"Found {len(users)} matching users")
-        
-        if users:
-            df = pd.DataFrame(users)
-            df = df[['name', 'email', 'phone', 'created_at']]
+            
+            if users:
+                df = pd.DataFrame(users, columns=columns)
+                df.columns = ['Name', 'Email', 'Phone', 'Created At']
+                st.dataframe(df, use_container_width=True, hide_index=True)
+        else:
+            page = read_table(user_service, 'users', 'get_users_page', cursor=get_page_cursor("users"))
+            df = pd.DataFrame(page['items'], columns=columns)
             df.columns = ['Name', 'Email', 'Phone', 'Created At']
             st.dataframe(df, use_container_width=True, hide_index=True)
+            render_pager("users", page)
+        
+        render_export('users')
     else:
         st.info("No users in database. Upload a CSV file to get started!")
     
@@ -310,7 +563,7 @@ Jane Smith,jane.smith@example.com,555-0102
 Bob Johnson,bob.johnson@example.com,555-0103
 Alice Williams,alice.williams@example.com,555-0104
 Charlie Brown,charlie.brown@example.com,555-0105"""
-    
+
     st.download_button(
         label="Download Sample CSV",
         data=sample_csv,
@@ -318,19 +571,52 @@ Charlie Brown,charlie.brown@example.com,555-0105"""
         mime="text/csv"
     )
 
+def render_debug_panel():
+    registry = get_registry()
+    
+    st.markdown("---")
+    
+    with st.expander("🐞 Debug: Performance Metrics"):
+        rows = registry.summary()
+        
+        if rows:
+            st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+        else:
+            st.info("No metrics recorded yet. Set METRICS_ENABLED=true to collect them.")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.download_button(
+                label="Download Prometheus Metrics",
+                data=registry.render_prometheus(),
+                file_name="metrics.prom",
+                mime="text/plain"
+            )
+        
+        with col2:
+            if st.button("Reset Metrics"):
+                registry.reset()
+                st.rerun()
+
 def main():
     services = get_services()
     
     selected_module = render_sidebar()
+    render_job_history(services['jobs'])
     
-    if "Books API" in selected_module:
-        render_books_module(services['books'])
-    
-    elif "Student Scores" in selected_module:
-        render_student_module(services['students'])
+    with timed('streamlit_render_seconds', module=selected_module.split(' ', 1)[-1]):
+        if "Books API" in selected_module:
+            render_books_module(services['books'], services['jobs'])
+        
+        elif "Student Scores" in selected_module:
+            render_student_module(services['students'], services['jobs'])
+        
+        elif "CSV Import" in selected_module:
+            render_csv_module(services['users'], services['jobs'])
     
-    elif "CSV Import" in selected_module:
-        render_csv_module(services['users'])
+    if get_config().debug:
+        render_debug_panel()
     
     st.markdown("---")
     st.markdown(
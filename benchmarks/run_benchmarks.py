@@ -0,0 +1,296 @@
+import argparse
+import ctypes
+import ctypes.util
+import csv
+import gc
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import tempfile
+import time
+import tracemalloc
+from dataclasses import replace
+from datetime import datetime, timezone
+
+from config import get_config
+from database.db import close_pool
+from utils.data_generator import generate_books, generate_users, seed_database
+from utils.openlibrary_stub import StubSettings, start_stub_server
+
+DEFAULT_SIZES = [1000, 100000, 1000000]
+SEARCH_TERMS = ["python", "data learn", "alice", "chen", "guide", "smith", "rosa", "modern sys"]
+
+def run_case(name, size, run, setup=None, repeat=1, rows=1, trace_memory=True):
+    latencies = []
+    
+    for _ in range(repeat):
+        if setup:
+            setup()
+        started = time.perf_counter()
+        run()
+        latencies.append(time.perf_counter() - started)
+    
+    peak_memory = None
+    memory_source = None
+    if trace_memory:
+        if setup:
+            setup()
+        peak_memory, memory_source = _measure_peak_memory(run)
+    
+    latencies.sort()
+    total = sum(latencies)
+    result = {
+        'name': name,
+        'size': size,
+        'repeat': repeat
+    }
+    
+    if repeat == 1:
+        result['seconds'] = round(latencies[0], 3)
+        timing = f"time={result['seconds']:>10.3f}s"
+    else:
+        result['mean_ms'] = round(statistics.fmean(latencies) * 1000, 3)
+        result['p50_ms'] = round(_percentile(latencies, 50) * 1000, 3)
+        result['p99_ms'] = round(_percentile(latencies, 99) * 1000, 3)
+        timing = f"p50={result['p50_ms']:>10.2f}ms  p99={result['p99_ms']:>10.2f}ms"
+    
+    result['throughput_per_s'] = round(rows * repeat / total, 1) if total else None
+    result['peak_memory_mb'] = round(peak_memory / (1024 * 1024), 2) if peak_memory is not None else None
+    result['memory_source'] = memory_source
+    
+    peak = f"{result['peak_memory_mb']}MB ({memory_source})" if peak_memory is not None else "-"
+    print(f"  {name:<42} {timing}  throughput={result['throughput_per_s']}/s  peak={peak}")
+    return result
+
+def _read_status_kb(field):
+    with open('/proc/self/status', encoding='ascii') as f:
+        for line in f:
+            if line.startswith(f"{field}:"):
+                return int(line.split()[1]) * 1024
+    return None
+
+def _release_free_memory():
+    gc.collect()
+    try:
+        import pyarrow as pa
+        pa.default_memory_pool().release_unused()
+    except (ImportError, AttributeError):
+        pass
+    try:
+        ctypes.CDLL(ctypes.util.find_library('c')).malloc_trim(0)
+    except (OSError, AttributeError, TypeError):
+        pass
+
+def _reset_peak_rss():
+    _release_free_memory()
+    try:
+        with open('/proc/self/clear_refs', 'w', encoding='ascii') as f:
+            f.write('5')
+        return _read_status_kb('VmHWM') is not None
+    except OSError:
+        return False
+
+def _measure_peak_memory(run):
+    # tracemalloc misses pyarrow and SQLite native allocations; on Linux the
+    # resident set high-water mark can be reset and read back per case, once
+    # freed heap from earlier cases has been handed back to the OS.
+    if _reset_peak_rss():
+        baseline = _read_status_kb('VmRSS')
+        run()
+        return max(_read_status_kb('VmHWM') - baseline, 0), 'rss'
+    
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1], 'tracemalloc'
+    finally:
+        tracemalloc.stop()
+
+def _percentile(sorted_values, percentile):
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    rank = (len(sorted_values) - 1) * percentile / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+
+def _write_users_csv(path, size, seed):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['name', 'email', 'phone'])
+        for chunk in generate_users(size, seed=seed):
+            writer.writerows((user['name'], user['email'], user['phone']) for user in chunk)
+
+def benchmark_size(size, workdir, repeat, seed):
+    from services.book_service import BookService
+    from services.student_service import StudentService
+    from services.user_service import UserService
+    
+    config = get_config()
+    config.database.path = os.path.join(workdir, f"bench_{size}.db")
+    close_pool()
+    
+    users = UserService()
+    books = BookService()
+    students = StudentService()
+    results = []
+    
+    csv_path = os.path.join(workdir, f"users_{size}.csv")
+    _write_users_csv(csv_path, size, seed)
+    results.append(run_case(
+        'user_service.import_from_csv_file', size,
+        lambda: users.import_from_csv_file(csv_path),
+        setup=users.clear_users, rows=size
+    ))
+    results.append(run_case(
+        'user_service.import_from_csv_file_parallel', size,
+        lambda: users.import_from_csv_file_parallel(csv_path),
+        setup=users.clear_users, rows=size
+    ))
+    
+    book_rows = [book for chunk in generate_books(size, seed=seed) for book in chunk]
+    results.append(run_case(
+        'book_service.save_books_to_db', size,
+        lambda rows=book_rows: books.save_books_to_db(rows),
+        setup=books.clear_books, rows=size
+    ))
+    del book_rows
+    
+    for name, search in [('book_service.search_books', books.search_books),
+                         ('user_service.search_users', users.search_users)]:
+        terms = iter(SEARCH_TERMS * repeat)
+        results.append(run_case(
+            name, size, lambda: search(next(terms)), repeat=repeat, trace_memory=False
+        ))
+    
+    students.clear_students()
+    seed_database('students', size, seed=seed)
+    
+    for method in ['calculate_statistics', 'get_scores_by_subject', 'get_scores_by_student',
+                   'get_top_performers', 'get_dashboard_snapshot', 'calculate_average_score']:
+        results.append(run_case(
+            f"student_service.{method}", size, getattr(students, method), repeat=repeat
+        ))
+    
+    results.append(run_case(
+        'student_service.get_score_analytics', size, students.get_score_analytics,
+        repeat=max(repeat // 10, 1), rows=size
+    ))
+    
+    close_pool()
+    return results
+
+def benchmark_fetch(repeat, workdir):
+    from utils.api_client import APIClient, fetch_books_from_open_library, iter_books_from_open_library
+    from utils.http_cache import ResponseCache
+    import utils.api_client as api_client
+    
+    config = get_config()
+    original_url = config.api.open_library_base_url
+    original_client = api_client._client
+    results = []
+    
+    paged_total = 2000
+    scenarios = [
+        ('', StubSettings(num_found=paged_total), False),
+        (' (20ms latency)', StubSettings(num_found=paged_total, latency=0.02), False),
+        (' (10% errors)', StubSettings(num_found=paged_total, error_rate=0.1), False),
+        (' (cached)', StubSettings(num_found=paged_total, latency=0.02), True)
+    ]
+    
+    for label, settings, cached in scenarios:
+        server = start_stub_server(settings)
+        config.api.open_library_base_url = server.base_url
+        cache = ResponseCache(os.path.join(workdir, 'http_cache.db')) if cached else None
+        api_client._client = APIClient(
+            replace(config.api, cache_enabled=cached, backoff_factor=0.01, max_retries=5, transport='live'),
+            cache=cache
+        )
+        
+        try:
+            results.append(run_case(
+                f"api_client.fetch_books_from_open_library{label}", 100,
+                lambda: fetch_books_from_open_library("benchmark", limit=100),
+                repeat=repeat, rows=100
+            ))
+            results.append(run_case(
+                f"api_client.iter_books_from_open_library{label}", paged_total,
+                lambda: sum(1 for _ in iter_books_from_open_library(
+                    "benchmark", page_size=100, prefetch=4
+                )),
+                repeat=max(repeat // 10, 1), rows=paged_total, trace_memory=False
+            ))
+            print(f"    server stats: {server.stats}")
+        finally:
+            api_client._client.close()
+            server.shutdown()
+            server.server_close()
+    
+    api_client._client = original_client
+    config.api.open_library_base_url = original_url
+    return results
+
+def compare(previous_path, results):
+    with open(previous_path, encoding='utf-8') as f:
+        previous = {(r['name'], r['size']): r for r in json.load(f)['results']}
+    
+    print("\nComparison against", previous_path)
+    for result in results:
+        old = previous.get((result['name'], result['size']))
+        old_ms, new_ms = _headline_ms(old), _headline_ms(result)
+        if not old_ms or new_ms is None:
+            continue
+        change = (new_ms - old_ms) / old_ms * 100
+        print(f"  {result['name']:<40} n={result['size']:<8} {old_ms:.2f} -> "
+              f"{new_ms:.2f}ms ({change:+.1f}%)")
+
+def _headline_ms(result):
+    if not result:
+        return None
+    if 'p50_ms' in result:
+        return result['p50_ms']
+    return result['seconds'] * 1000 if result.get('seconds') is not None else None
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ingestion, search and analytics")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--compare', help="Previous results JSON to compare against")
+    args = parser.parse_args()
+    
+    results = []
+    with tempfile.TemporaryDirectory(prefix='bench_') as workdir:
+        for size in args.sizes:
+            print(f"\nSize {size}")
+            results.extend(benchmark_size(size, workdir, args.repeat, args.seed))
+        
+        print("\nHTTP fetch (local Open Library stub)")
+        results.extend(benchmark_fetch(args.repeat, workdir))
+    
+    report = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'app_version': get_config().app_version,
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'platform': platform.platform(),
+            'sizes': args.sizes,
+            'repeat': args.repeat,
+            'seed': args.seed
+        },
+        'results': results
+    }
+    
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+    
+    if args.compare:
+        compare(args.compare, results)
+
+if __name__ == "__main__":
+    main()
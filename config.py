@@ -5,30 +5,116 @@ from dataclasses import dataclass, field
 class DatabaseConfig:
     path: str = "books.db"
     timeout: int = 30
+    pool_size: int = 5
+    batch_size: int = 5000
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    mmap_size: int = 256 * 1024 * 1024
+    cache_size: int = -64000
+    temp_store: str = "MEMORY"
+    search_limit: int = 100
+    page_size: int = 50
     
     def __post_init__(self):
         self.path = os.environ.get('DATABASE_PATH', self.path)
+        self.pool_size = int(os.environ.get('DATABASE_POOL_SIZE', self.pool_size))
+        self.batch_size = int(os.environ.get('DATABASE_BATCH_SIZE', self.batch_size))
+    
+    def pragmas(self):
+        return {
+            'journal_mode': self.journal_mode,
+            'synchronous': self.synchronous,
+            'mmap_size': self.mmap_size,
+            'cache_size': self.cache_size,
+            'temp_store': self.temp_store,
+            'recursive_triggers': 'ON'
+        }
 
 @dataclass
 class APIConfig:
     open_library_base_url: str = "https://openlibrary.org"
     timeout: int = 30
     max_retries: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    pool_maxsize: int = 10
+    max_concurrency: int = 8
+    per_host_limit: int = 4
+    retry_statuses: tuple = (429, 500, 502, 503, 504)
+    cache_enabled: bool = True
+    cache_path: str = "http_cache.db"
+    cache_ttl: int = 3600
+    cache_max_entries: int = 1000
+    transport: str = "live"
+    fixtures_dir: str = "fixtures"
     
     def __post_init__(self):
         self.timeout = int(os.environ.get('API_TIMEOUT', self.timeout))
+        self.max_retries = int(os.environ.get('API_MAX_RETRIES', self.max_retries))
+        self.open_library_base_url = os.environ.get('OPEN_LIBRARY_BASE_URL', self.open_library_base_url)
+        self.cache_enabled = os.environ.get('API_CACHE_ENABLED', str(self.cache_enabled)).lower() == 'true'
+        self.cache_path = os.environ.get('API_CACHE_PATH', self.cache_path)
+        self.cache_ttl = int(os.environ.get('API_CACHE_TTL', self.cache_ttl))
+        self.transport = os.environ.get('API_TRANSPORT', self.transport).lower()
+        self.fixtures_dir = os.environ.get('API_FIXTURES_DIR', self.fixtures_dir)
+
+@dataclass
+class ImportConfig:
+    workers: int = 0
+    chunk_bytes: int = 8 * 1024 * 1024
+    engine: str = "auto"
+    reject_dir: str = "rejections"
+    reject_format: str = "csv"
+    reject_keep: int = 20
+    reject_download_max_mb: int = 50
+    
+    def __post_init__(self):
+        self.workers = int(os.environ.get('IMPORT_WORKERS', self.workers)) or os.cpu_count() or 1
+        self.chunk_bytes = int(os.environ.get('IMPORT_CHUNK_BYTES', self.chunk_bytes))
+        self.engine = os.environ.get('IMPORT_ENGINE', self.engine).lower()
+        self.reject_dir = os.environ.get('IMPORT_REJECT_DIR', self.reject_dir)
+        self.reject_format = os.environ.get('IMPORT_REJECT_FORMAT', self.reject_format).lower()
+        self.reject_keep = int(os.environ.get('IMPORT_REJECT_KEEP', self.reject_keep))
+        self.reject_download_max_mb = int(
+            os.environ.get('IMPORT_REJECT_DOWNLOAD_MAX_MB', self.reject_download_max_mb)
+        )
+
+@dataclass
+class JobConfig:
+    workers: int = 2
+    progress_interval: float = 0.5
+    poll_interval: float = 1.0
+    
+    def __post_init__(self):
+        self.workers = int(os.environ.get('JOB_WORKERS', self.workers))
+        self.poll_interval = float(os.environ.get('JOB_POLL_INTERVAL', self.poll_interval))
+
+@dataclass
+class ExportConfig:
+    download_max_mb: int = 50
+    temp_max_age: int = 3600
+    
+    def __post_init__(self):
+        self.download_max_mb = int(os.environ.get('EXPORT_DOWNLOAD_MAX_MB', self.download_max_mb))
+        self.temp_max_age = int(os.environ.get('EXPORT_TEMP_MAX_AGE', self.temp_max_age))
 
 @dataclass
 class AppConfig:
     app_name: str = "AI-ML Assignment"
     app_version: str = "1.0.0"
     debug: bool = False
+    cache_ttl: int = 300
+    metrics_enabled: bool = False
     
     database: DatabaseConfig = field(default_factory=DatabaseConfig)
     api: APIConfig = field(default_factory=APIConfig)
+    imports: ImportConfig = field(default_factory=ImportConfig)
+    jobs: JobConfig = field(default_factory=JobConfig)
+    exports: ExportConfig = field(default_factory=ExportConfig)
     
     def __post_init__(self):
         self.debug = os.environ.get('DEBUG', 'false').lower() == 'true'
+        self.metrics_enabled = os.environ.get('METRICS_ENABLED', str(self.debug)).lower() == 'true'
 
 config = AppConfig()
 
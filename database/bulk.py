@@ -0,0 +1,56 @@
+import sqlite3
+from itertools import islice
+
+from config import get_config
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def bulk_insert(conn, sql, rows, chunk_size=None):
+    chunk_size = chunk_size or get_config().database.batch_size
+    inserted = 0
+    failures = []
+    
+    for chunk in chunked(rows, chunk_size):
+        chunk_inserted, chunk_failures = _insert_chunk(conn, sql, chunk)
+        inserted += chunk_inserted
+        failures.extend(chunk_failures)
+    
+    return inserted, failures
+
+def _insert_chunk(conn, sql, chunk):
+    conn.execute("SAVEPOINT bulk_chunk")
+    try:
+        try:
+            conn.executemany(sql, chunk)
+            return len(chunk), []
+        except sqlite3.Error:
+            conn.execute("ROLLBACK TO bulk_chunk")
+            return _insert_rows(conn, sql, chunk)
+    except Exception:
+        conn.execute("ROLLBACK TO bulk_chunk")
+        raise
+    finally:
+        conn.execute("RELEASE bulk_chunk")
+
+def _insert_rows(conn, sql, rows):
+    inserted = 0
+    failures = []
+    
+    for row in rows:
+        conn.execute("SAVEPOINT bulk_row")
+        try:
+            conn.execute(sql, row)
+            inserted += 1
+        except sqlite3.Error as e:
+            conn.execute("ROLLBACK TO bulk_row")
+            failures.append((row, e))
+        finally:
+            conn.execute("RELEASE bulk_row")
+    
+    return inserted, failures
@@ -1,61 +1,210 @@
 import sqlite3
 import os
+import re
+import queue
+import threading
+import time
 from contextlib import contextmanager
 
-DATABASE_PATH = os.environ.get('DATABASE_PATH', 'books.db')
+from config import get_config
+from database.migrations import run_migrations
+from utils.metrics import get_registry, metrics_enabled, statement_label
+
+class InstrumentedCursor(sqlite3.Cursor):
+    def execute(self, sql, parameters=()):
+        started = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self._record(sql, started)
+    
+    def executemany(self, sql, seq_of_parameters):
+        started = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            self._record(sql, started)
+    
+    def fetchone(self):
+        row = super().fetchone()
+        if row is not None:
+            self._record_rows(1)
+        return row
+    
+    def fetchmany(self, size=None):
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._record_rows(len(rows))
+        return rows
+    
+    def fetchall(self):
+        rows = super().fetchall()
+        self._record_rows(len(rows))
+        return rows
+    
+    def _record(self, sql, started):
+        registry = get_registry()
+        self._statement = statement_label(sql)
+        registry.observe('sqlite_query_seconds', time.perf_counter() - started, statement=self._statement)
+        if self.rowcount > 0:
+            registry.increment('sqlite_rows_written_total', self.rowcount, statement=self._statement)
+    
+    def _record_rows(self, count):
+        if count:
+            get_registry().increment(
+                'sqlite_rows_read_total', count, statement=getattr(self, '_statement', 'unknown')
+            )
+
+class InstrumentedConnection(sqlite3.Connection):
+    def cursor(self, factory=None):
+        return super().cursor(factory or InstrumentedCursor)
+    
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+    
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+class ConnectionPool:
+    def __init__(self, path, size=5, timeout=30, pragmas=None, instrumented=False):
+        self.path = path
+        self.size = size
+        self.timeout = timeout
+        self.pragmas = pragmas or {}
+        self.factory = InstrumentedConnection if instrumented else sqlite3.Connection
+        self._idle = queue.LifoQueue(maxsize=max(size, 1))
+    
+    def _connect(self):
+        conn = sqlite3.connect(
+            self.path, timeout=self.timeout, check_same_thread=False, factory=self.factory
+        )
+        conn.row_factory = sqlite3.Row
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        return conn
+    
+    def acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect()
+    
+    def release(self, conn):
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put_nowait(conn)
+        except (queue.Full, sqlite3.Error):
+            conn.close()
+    
+    def close(self):
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+
+_pool = None
+_pool_lock = threading.Lock()
+_initialized_paths = set()
+_init_lock = threading.Lock()
+_table_generations = {}
+_generation_lock = threading.Lock()
 
 def get_db_path():
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    return os.path.join(base_dir, DATABASE_PATH)
+    return os.path.join(base_dir, get_config().database.path)
+
+def get_pool():
+    global _pool
+    path = get_db_path()
+    
+    if _pool is None or _pool.path != path:
+        with _pool_lock:
+            if _pool is None or _pool.path != path:
+                if _pool is not None:
+                    _pool.close()
+                db_config = get_config().database
+                _pool = ConnectionPool(
+                    path,
+                    size=db_config.pool_size,
+                    timeout=db_config.timeout,
+                    pragmas=db_config.pragmas(),
+                    instrumented=metrics_enabled()
+                )
+    
+    return _pool
+
+def close_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
 
 @contextmanager
 def get_connection():
-    conn = None
+    pool = get_pool()
+    conn = pool.acquire()
     try:
-        conn = sqlite3.connect(get_db_path())
-        conn.row_factory = sqlite3.Row
         yield conn
     finally:
-        if conn:
-            conn.close()
+        pool.release(conn)
+
+def mark_table_changed(*tables):
+    with _generation_lock:
+        for table in tables:
+            _table_generations[table] = _table_generations.get(table, 0) + 1
+
+def get_table_generation(table):
+    return _table_generations.get(table, 0)
 
 def initialize_database():
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS books (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                author TEXT NOT NULL,
-                publication_year INTEGER,
-                isbn TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(title, author)
-            )
-        """)
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS students (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                subject TEXT NOT NULL,
-                score REAL NOT NULL CHECK(score >= 0 AND score <= 100),
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+    path = get_db_path()
+    if path in _initialized_paths:
+        return
+    
+    with _init_lock:
+        if path in _initialized_paths:
+            return
         
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                email TEXT NOT NULL UNIQUE,
-                phone TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+        with get_connection() as conn:
+            run_migrations(conn)
         
-        conn.commit()
+        _initialized_paths.add(path)
+
+def fetch_page(conn, table, columns, key_columns, cursor=None, page_size=None, descending=False):
+    page_size = page_size or get_config().database.page_size
+    direction = 'DESC' if descending else 'ASC'
+    keys = ', '.join(key_columns)
+    
+    where = ''
+    params = []
+    if cursor:
+        comparison = '<' if descending else '>'
+        placeholders = ', '.join('?' for _ in key_columns)
+        where = f"WHERE ({keys}) {comparison} ({placeholders})"
+        params.extend(cursor)
+    
+    order = ', '.join(f"{column} {direction}" for column in key_columns)
+    rows = conn.execute(f"""
+        SELECT {', '.join(columns)}
+        FROM {table}
+        {where}
+        ORDER BY {order}
+        LIMIT ?
+    """, (*params, page_size + 1)).fetchall()
+    
+    items = [dict(row) for row in rows[:page_size]]
+    next_cursor = None
+    if len(rows) > page_size:
+        next_cursor = tuple(items[-1][column] for column in key_columns)
+    
+    return {'items': items, 'next_cursor': next_cursor}
+
+def build_fts_query(search_term):
+    tokens = re.findall(r'\w+', search_term or '')
+    return ' '.join(f'"{token}"*' for token in tokens)
 
 def clear_table(table_name):
     valid_tables = {'books', 'students', 'users'}
@@ -66,6 +215,7 @@ def clear_table(table_name):
         cursor = conn.execute(f"DELETE FROM {table_name}")
         deleted_count = cursor.rowcount
         conn.commit()
+        mark_table_changed(table_name)
         return deleted_count
 
 def get_table_count(table_name):
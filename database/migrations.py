@@ -0,0 +1,323 @@
+MIGRATIONS = [
+    (1, [
+        """
+        CREATE TABLE IF NOT EXISTS books (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            author TEXT NOT NULL,
+            publication_year INTEGER,
+            isbn TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(title, author)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS students (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            subject TEXT NOT NULL,
+            score REAL NOT NULL CHECK(score >= 0 AND score <= 100),
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            email TEXT NOT NULL UNIQUE,
+            phone TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    ]),
+    (2, [
+        "CREATE INDEX IF NOT EXISTS idx_books_created_at ON books(created_at, id)",
+        "CREATE INDEX IF NOT EXISTS idx_students_name_subject ON students(name, subject)",
+        "CREATE INDEX IF NOT EXISTS idx_students_name_score ON students(name, score)",
+        "CREATE INDEX IF NOT EXISTS idx_students_subject_score ON students(subject, score)",
+        "CREATE INDEX IF NOT EXISTS idx_users_created_at ON users(created_at, id)",
+        "CREATE INDEX IF NOT EXISTS idx_users_name ON users(name)",
+        "CREATE INDEX IF NOT EXISTS idx_users_phone ON users(phone)",
+        "ANALYZE"
+    ]),
+    (3, [
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS books_fts USING fts5(
+            title, author, content='books', content_rowid='id'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS books_fts_ai AFTER INSERT ON books BEGIN
+            INSERT INTO books_fts(rowid, title, author)
+            VALUES (new.id, new.title, new.author);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS books_fts_ad AFTER DELETE ON books BEGIN
+            INSERT INTO books_fts(books_fts, rowid, title, author)
+            VALUES ('delete', old.id, old.title, old.author);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS books_fts_au AFTER UPDATE ON books BEGIN
+            INSERT INTO books_fts(books_fts, rowid, title, author)
+            VALUES ('delete', old.id, old.title, old.author);
+            INSERT INTO books_fts(rowid, title, author)
+            VALUES (new.id, new.title, new.author);
+        END
+        """,
+        "INSERT INTO books_fts(books_fts) VALUES ('rebuild')",
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5(
+            name, email, content='users', content_rowid='id'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS users_fts_ai AFTER INSERT ON users BEGIN
+            INSERT INTO users_fts(rowid, name, email)
+            VALUES (new.id, new.name, new.email);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS users_fts_ad AFTER DELETE ON users BEGIN
+            INSERT INTO users_fts(users_fts, rowid, name, email)
+            VALUES ('delete', old.id, old.name, old.email);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS users_fts_au AFTER UPDATE ON users BEGIN
+            INSERT INTO users_fts(users_fts, rowid, name, email)
+            VALUES ('delete', old.id, old.name, old.email);
+            INSERT INTO users_fts(rowid, name, email)
+            VALUES (new.id, new.name, new.email);
+        END
+        """,
+        "INSERT INTO users_fts(users_fts) VALUES ('rebuild')"
+    ]),
+    (4, [
+        """
+        CREATE TABLE IF NOT EXISTS student_subject_stats (
+            subject TEXT PRIMARY KEY,
+            record_count INTEGER NOT NULL,
+            score_sum REAL NOT NULL,
+            score_sum_sq REAL NOT NULL,
+            min_score REAL,
+            max_score REAL
+        )
+        """,
+        """
+        INSERT OR REPLACE INTO student_subject_stats
+            (subject, record_count, score_sum, score_sum_sq, min_score, max_score)
+        SELECT subject, COUNT(*), SUM(score), SUM(score * score), MIN(score), MAX(score)
+        FROM students
+        GROUP BY subject
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS student_name_stats (
+            name TEXT PRIMARY KEY,
+            record_count INTEGER NOT NULL,
+            score_sum REAL NOT NULL,
+            score_sum_sq REAL NOT NULL,
+            min_score REAL,
+            max_score REAL
+        )
+        """,
+        """
+        INSERT OR REPLACE INTO student_name_stats
+            (name, record_count, score_sum, score_sum_sq, min_score, max_score)
+        SELECT name, COUNT(*), SUM(score), SUM(score * score), MIN(score), MAX(score)
+        FROM students
+        GROUP BY name
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS students_stats_ai AFTER INSERT ON students BEGIN
+            INSERT INTO student_subject_stats
+                (subject, record_count, score_sum, score_sum_sq, min_score, max_score)
+            VALUES (new.subject, 1, new.score, new.score * new.score, new.score, new.score)
+            ON CONFLICT(subject) DO UPDATE SET
+                record_count = record_count + 1,
+                score_sum = score_sum + excluded.score_sum,
+                score_sum_sq = score_sum_sq + excluded.score_sum_sq,
+                min_score = MIN(min_score, excluded.min_score),
+                max_score = MAX(max_score, excluded.max_score);
+            INSERT INTO student_name_stats
+                (name, record_count, score_sum, score_sum_sq, min_score, max_score)
+            VALUES (new.name, 1, new.score, new.score * new.score, new.score, new.score)
+            ON CONFLICT(name) DO UPDATE SET
+                record_count = record_count + 1,
+                score_sum = score_sum + excluded.score_sum,
+                score_sum_sq = score_sum_sq + excluded.score_sum_sq,
+                min_score = MIN(min_score, excluded.min_score),
+                max_score = MAX(max_score, excluded.max_score);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS students_stats_ad AFTER DELETE ON students BEGIN
+            UPDATE student_subject_stats SET
+                record_count = record_count - 1,
+                score_sum = score_sum - old.score,
+                score_sum_sq = score_sum_sq - old.score * old.score,
+                min_score = CASE WHEN old.score <= min_score
+                    THEN (SELECT MIN(score) FROM students WHERE subject = old.subject)
+                    ELSE min_score END,
+                max_score = CASE WHEN old.score >= max_score
+                    THEN (SELECT MAX(score) FROM students WHERE subject = old.subject)
+                    ELSE max_score END
+            WHERE subject = old.subject;
+            DELETE FROM student_subject_stats WHERE subject = old.subject AND record_count <= 0;
+            UPDATE student_name_stats SET
+                record_count = record_count - 1,
+                score_sum = score_sum - old.score,
+                score_sum_sq = score_sum_sq - old.score * old.score,
+                min_score = CASE WHEN old.score <= min_score
+                    THEN (SELECT MIN(score) FROM students WHERE name = old.name)
+                    ELSE min_score END,
+                max_score = CASE WHEN old.score >= max_score
+                    THEN (SELECT MAX(score) FROM students WHERE name = old.name)
+                    ELSE max_score END
+            WHERE name = old.name;
+            DELETE FROM student_name_stats WHERE name = old.name AND record_count <= 0;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS students_stats_au AFTER UPDATE OF name, subject, score ON students BEGIN
+            UPDATE student_subject_stats SET
+                record_count = record_count - 1,
+                score_sum = score_sum - old.score,
+                score_sum_sq = score_sum_sq - old.score * old.score,
+                min_score = CASE WHEN old.score <= min_score
+                    THEN (SELECT MIN(score) FROM students WHERE subject = old.subject)
+                    ELSE min_score END,
+                max_score = CASE WHEN old.score >= max_score
+                    THEN (SELECT MAX(score) FROM students WHERE subject = old.subject)
+                    ELSE max_score END
+            WHERE subject = old.subject;
+            DELETE FROM student_subject_stats WHERE subject = old.subject AND record_count <= 0;
+            UPDATE student_name_stats SET
+                record_count = record_count - 1,
+                score_sum = score_sum - old.score,
+                score_sum_sq = score_sum_sq - old.score * old.score,
+                min_score = CASE WHEN old.score <= min_score
+                    THEN (SELECT MIN(score) FROM students WHERE name = old.name)
+                    ELSE min_score END,
+                max_score = CASE WHEN old.score >= max_score
+                    THEN (SELECT MAX(score) FROM students WHERE name = old.name)
+                    ELSE max_score END
+            WHERE name = old.name;
+            DELETE FROM student_name_stats WHERE name = old.name AND record_count <= 0;
+            INSERT INTO student_subject_stats
+                (subject, record_count, score_sum, score_sum_sq, min_score, max_score)
+            VALUES (new.subject, 1, new.score, new.score * new.score, new.score, new.score)
+            ON CONFLICT(subject) DO UPDATE SET
+                record_count = record_count + 1,
+                score_sum = score_sum + excluded.score_sum,
+                score_sum_sq = score_sum_sq + excluded.score_sum_sq,
+                min_score = MIN(min_score, excluded.min_score),
+                max_score = MAX(max_score, excluded.max_score);
+            INSERT INTO student_name_stats
+                (name, record_count, score_sum, score_sum_sq, min_score, max_score)
+            VALUES (new.name, 1, new.score, new.score * new.score, new.score, new.score)
+            ON CONFLICT(name) DO UPDATE SET
+                record_count = record_count + 1,
+                score_sum = score_sum + excluded.score_sum,
+                score_sum_sq = score_sum_sq + excluded.score_sum_sq,
+                min_score = MIN(min_score, excluded.min_score),
+                max_score = MAX(max_score, excluded.max_score);
+        END
+        """
+    ]),
+    (5, [
+        """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'queued'
+                CHECK(status IN ('queued', 'running', 'succeeded', 'failed', 'cancelled', 'interrupted')),
+            params TEXT NOT NULL DEFAULT '{}',
+            progress_current INTEGER NOT NULL DEFAULT 0,
+            progress_total INTEGER,
+            message TEXT,
+            result TEXT,
+            error TEXT,
+            cancel_requested INTEGER NOT NULL DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            started_at TIMESTAMP,
+            finished_at TIMESTAMP
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status)"
+    ]),
+    (6, [
+        """
+        CREATE TABLE users_nocase (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            email TEXT NOT NULL UNIQUE COLLATE NOCASE,
+            phone TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        INSERT INTO users_nocase (id, name, email, phone, created_at)
+        SELECT id, name, LOWER(TRIM(email)), phone, created_at
+        FROM users
+        WHERE id IN (SELECT MIN(id) FROM users GROUP BY LOWER(TRIM(email)))
+        """,
+        "DROP TABLE users",
+        "ALTER TABLE users_nocase RENAME TO users",
+        "CREATE INDEX IF NOT EXISTS idx_users_created_at ON users(created_at, id)",
+        "CREATE INDEX IF NOT EXISTS idx_users_name ON users(name)",
+        "CREATE INDEX IF NOT EXISTS idx_users_phone ON users(phone)",
+        """
+        CREATE TRIGGER IF NOT EXISTS users_fts_ai AFTER INSERT ON users BEGIN
+            INSERT INTO users_fts(rowid, name, email)
+            VALUES (new.id, new.name, new.email);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS users_fts_ad AFTER DELETE ON users BEGIN
+            INSERT INTO users_fts(users_fts, rowid, name, email)
+            VALUES ('delete', old.id, old.name, old.email);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS users_fts_au AFTER UPDATE ON users BEGIN
+            INSERT INTO users_fts(users_fts, rowid, name, email)
+            VALUES ('delete', old.id, old.name, old.email);
+            INSERT INTO users_fts(rowid, name, email)
+            VALUES (new.id, new.name, new.email);
+        END
+        """,
+        "INSERT INTO users_fts(users_fts) VALUES ('rebuild')",
+        "ANALYZE users"
+    ])
+]
+
+def get_schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+def run_migrations(conn):
+    applied = []
+    
+    for version, statements in MIGRATIONS:
+        if version <= get_schema_version(conn):
+            continue
+        
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if version <= get_schema_version(conn):
+                conn.rollback()
+                continue
+            
+            for statement in statements:
+                conn.execute(statement)
+            
+            conn.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        
+        applied.append(version)
+    
+    return applied
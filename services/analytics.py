@@ -0,0 +1,62 @@
+import numpy as np
+
+DEFAULT_PERCENTILES = (10, 25, 50, 75, 90)
+
+def compute_score_analytics(names, subjects, name_codes, subject_codes, scores,
+                            bins=10, percentiles=DEFAULT_PERCENTILES):
+    scores = np.asarray(scores, dtype=np.float64)
+    name_codes = np.asarray(name_codes, dtype=np.intp)
+    subject_codes = np.asarray(subject_codes, dtype=np.intp)
+    
+    if scores.size == 0:
+        return None
+    
+    n_names = len(names)
+    n_subjects = len(subjects)
+    
+    hist_counts, hist_edges = np.histogram(scores, bins=bins, range=(0, 100))
+    
+    subject_count = np.bincount(subject_codes, minlength=n_subjects)
+    subject_mean = _group_mean(subject_codes, scores, subject_count, n_subjects)
+    subject_mean_sq = _group_mean(subject_codes, scores * scores, subject_count, n_subjects)
+    subject_std = np.sqrt(np.maximum(subject_mean_sq - subject_mean ** 2, 0.0))
+    
+    row_std = subject_std[subject_codes]
+    z_scores = np.divide(
+        scores - subject_mean[subject_codes], row_std,
+        out=np.zeros_like(scores), where=row_std > 0
+    )
+    z_counts, z_edges = np.histogram(z_scores, bins=bins, range=(-3, 3))
+    
+    cells = name_codes * n_subjects + subject_codes
+    cell_count = np.bincount(cells, minlength=n_names * n_subjects)
+    cell_sum = np.bincount(cells, weights=scores, minlength=n_names * n_subjects)
+    pivot = np.full(n_names * n_subjects, np.nan)
+    np.divide(cell_sum, cell_count, out=pivot, where=cell_count > 0)
+    
+    return {
+        'count': int(scores.size),
+        'mean': float(scores.mean()),
+        'median': float(np.median(scores)),
+        'std_dev': float(scores.std()),
+        'percentiles': dict(zip(percentiles, np.percentile(scores, percentiles).tolist())),
+        'histogram': {'counts': hist_counts, 'edges': hist_edges},
+        'subjects': {
+            'names': list(subjects),
+            'count': subject_count,
+            'mean': subject_mean,
+            'std_dev': subject_std
+        },
+        'z_histogram': {'counts': z_counts, 'edges': z_edges},
+        'pivot': {
+            'students': list(names),
+            'subjects': list(subjects),
+            'matrix': pivot.reshape(n_names, n_subjects)
+        }
+    }
+
+def _group_mean(codes, values, counts, size):
+    sums = np.bincount(codes, weights=values, minlength=size)
+    means = np.zeros(size)
+    np.divide(sums, counts, out=means, where=counts > 0)
+    return means
@@ -1,6 +1,11 @@
-from database.db import get_connection, initialize_database
-from utils.api_client import fetch_books_from_open_library, APIError
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from database.db import get_connection, initialize_database, mark_table_changed, fetch_page, build_fts_query
+from database.bulk import bulk_insert, chunked
+from config import get_config
+from utils.api_client import fetch_books_from_open_library, iter_books_from_open_library, APIError
+from utils.metrics import instrument_methods
 
+@instrument_methods('books')
 class BookService:
     def __init__(self):
         initialize_database()
@@ -12,28 +17,27 @@ class BookService:
         except APIError as e:
             raise
     
-    def save_books_to_db(self, books):
-        saved_count = 0
+    def save_books_to_db(self, books, chunk_size=None):
+        rows = (
+            (
+                book.get('title'),
+                book.get('author'),
+                book.get('publication_year'),
+                book.get('isbn')
+            )
+            for book in books
+        )
         
         with get_connection() as conn:
-            cursor = conn.cursor()
-            
-            for book in books:
-                try:
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO books (title, author, publication_year, isbn)
-                        VALUES (?, ?, ?, ?)
-                    """, (
-                        book.get('title'),
-                        book.get('author'),
-                        book.get('publication_year'),
-                        book.get('isbn')
-                    ))
-                    saved_count += 1
-                except Exception as e:
-                    print(f"Error saving book: {e}")
-            
-            conn.commit()
+            saved_count, failures = bulk_insert(conn, """
+                INSERT OR REPLACE INTO books (title, author, publication_year, isbn)
+                VALUES (?, ?, ?, ?)
+            """, rows, chunk_size)
+        
+        mark_table_changed('books')
+        
+        for row, error in failures:
+            print(f"Error saving book: {error}")
         
         return saved_count
     
@@ -58,19 +62,54 @@ class BookService:
         
         return books
     
+    def get_books_page(self, page_size=None, cursor=None):
+        with get_connection() as conn:
+            return fetch_page(
+                conn, 'books',
+                ['id', 'title', 'author', 'publication_year', 'isbn', 'created_at'],
+                ['created_at', 'id'],
+                cursor=cursor, page_size=page_size, descending=True
+            )
+    
+    def get_book_statistics(self):
+        with get_connection() as conn:
+            cursor = conn.execute("""
+                SELECT
+                    COUNT(*) as count,
+                    COUNT(DISTINCT author) as author_count,
+                    AVG(publication_year) as average_year
+                FROM books
+            """)
+            
+            row = cursor.fetchone()
+            
+            return {
+                'total_books': row['count'],
+                'unique_authors': row['author_count'],
+                'average_year': int(row['average_year']) if row['average_year'] else None
+            }
+    
     def get_book_count(self):
         with get_connection() as conn:
             cursor = conn.execute("SELECT COUNT(*) FROM books")
             return cursor.fetchone()[0]
     
-    def search_books(self, search_term):
+    def search_books(self, search_term, limit=None):
+        match_query = build_fts_query(search_term)
+        if not match_query:
+            return []
+        
+        limit = limit or get_config().database.search_limit
+        
         with get_connection() as conn:
             cursor = conn.execute("""
-                SELECT id, title, author, publication_year, isbn, created_at
-                FROM books
-                WHERE title LIKE ? OR author LIKE ?
-                ORDER BY title
-            """, (f'%{search_term}%', f'%{search_term}%'))
+                SELECT b.id, b.title, b.author, b.publication_year, b.isbn, b.created_at
+                FROM books_fts
+                JOIN books b ON b.id = books_fts.rowid
+                WHERE books_fts MATCH ?
+                ORDER BY bm25(books_fts)
+                LIMIT ?
+            """, (match_query, limit))
             
             return [dict(row) for row in cursor.fetchall()]
     
@@ -79,6 +118,7 @@ class BookService:
             cursor = conn.execute("DELETE FROM books")
             deleted = cursor.rowcount
             conn.commit()
+            mark_table_changed('books')
             return deleted
     
     def fetch_and_store_books(self, query="python programming", limit=10):
@@ -96,7 +136,88 @@ class BookService:
             saved = self.save_books_to_db(books)
             result['saved'] = saved
             result['success'] = True
+        
+        except Exception as e:
+            result['error'] = str(e)
+        
+        return result
+    
+    def fetch_and_store_many(self, queries, limit=10, max_workers=None, progress_callback=None):
+        queries = list(dict.fromkeys(queries))
+        result = {
+            'success': False,
+            'queries': len(queries),
+            'fetched': 0,
+            'saved': 0,
+            'failed_queries': {},
+            'cancelled': False,
+            'error': None
+        }
+        
+        max_workers = max_workers or get_config().api.max_concurrency
+        batch_size = get_config().database.batch_size
+        pending = []
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.fetch_books_from_api, query, limit): query
+                for query in queries
+            }
+            
+            for completed, future in enumerate(as_completed(futures), start=1):
+                query = futures[future]
+                
+                try:
+                    books = future.result()
+                except Exception as e:
+                    result['failed_queries'][query] = str(e)
+                else:
+                    result['fetched'] += len(books)
+                    pending.extend(books)
+                
+                if len(pending) >= batch_size:
+                    result['saved'] += self.save_books_to_db(pending)
+                    pending = []
+                
+                if progress_callback and progress_callback(completed, len(queries)) is False:
+                    result['cancelled'] = True
+                    for pending_future in futures:
+                        pending_future.cancel()
+                    break
+        
+        if pending:
+            result['saved'] += self.save_books_to_db(pending)
+        
+        if queries and len(result['failed_queries']) == len(queries):
+            result['error'] = "All queries failed"
+        else:
+            result['success'] = True
+        
+        return result
+    
+    def fetch_and_store_all(self, query="python programming", page_size=100, max_results=None,
+                            progress_callback=None):
+        result = {
+            'success': False,
+            'fetched': 0,
+            'saved': 0,
+            'cancelled': False,
+            'error': None
+        }
+        
+        try:
+            books = iter_books_from_open_library(query, page_size=page_size, max_results=max_results)
             
+            for chunk in chunked(books, get_config().database.batch_size):
+                result['fetched'] += len(chunk)
+                result['saved'] += self.save_books_to_db(chunk)
+                
+                if progress_callback and progress_callback(result['fetched'], result['saved']) is False:
+                    result['cancelled'] = True
+                    break
+            
+            result['success'] = True
+        
         except Exception as e:
             result['error'] = str(e)
         
@@ -0,0 +1,245 @@
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+from config import get_config
+from database.db import get_connection, initialize_database
+from utils.metrics import instrument_methods
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+EXPORT_TABLES = {
+    'books': [
+        ('id', 'int64'), ('title', 'string'), ('author', 'string'),
+        ('publication_year', 'int64'), ('isbn', 'string'), ('created_at', 'timestamp')
+    ],
+    'students': [
+        ('id', 'int64'), ('name', 'string'), ('subject', 'string'),
+        ('score', 'float64'), ('created_at', 'timestamp')
+    ],
+    'users': [
+        ('id', 'int64'), ('name', 'string'), ('email', 'string'),
+        ('phone', 'string'), ('created_at', 'timestamp')
+    ]
+}
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'jsonl': 'application/x-ndjson',
+    'parquet': 'application/vnd.apache.parquet'
+}
+
+TEMP_PREFIX = 'export_'
+
+class ExportError(Exception):
+    pass
+
+def get_export_formats():
+    return [fmt for fmt in EXPORT_FORMATS if fmt != 'parquet' or pa is not None]
+
+def cleanup_temp_exports(max_age):
+    cutoff = time.time() - max_age
+    removed = 0
+    
+    for name in os.listdir(tempfile.gettempdir()):
+        if not name.startswith(TEMP_PREFIX):
+            continue
+        path = os.path.join(tempfile.gettempdir(), name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+                removed += 1
+        except OSError:
+            pass
+    
+    return removed
+
+def iter_table_chunks(table, chunk_size=None):
+    if table not in EXPORT_TABLES:
+        raise ExportError(f"Invalid export table: {table}")
+    
+    chunk_size = chunk_size or get_config().database.batch_size
+    columns = ', '.join(name for name, _ in EXPORT_TABLES[table])
+    
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(f"SELECT {columns} FROM {table} ORDER BY id")
+        
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield rows
+
+def _drain(buffer):
+    data = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return data
+
+def _write_csv(columns, chunks):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(name for name, _ in columns)
+    
+    for rows in chunks:
+        writer.writerows(rows)
+        yield _drain(buffer).encode('utf-8')
+    
+    data = _drain(buffer)
+    if data:
+        yield data.encode('utf-8')
+
+def _write_jsonl(columns, chunks):
+    names = [name for name, _ in columns]
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    
+    for rows in chunks:
+        yield ''.join(encode(dict(zip(names, row))) + '\n' for row in rows).encode('utf-8')
+
+def _write_parquet(columns, chunks):
+    if pa is None:
+        raise ExportError("Parquet export requires pyarrow to be installed")
+    
+    types = {
+        'int64': pa.int64(),
+        'float64': pa.float64(),
+        'string': pa.string(),
+        'timestamp': pa.timestamp('s')
+    }
+    schema = pa.schema([(name, types[kind]) for name, kind in columns])
+    
+    sink = io.BytesIO()
+    writer = pq.ParquetWriter(sink, schema, compression='snappy')
+    try:
+        for rows in chunks:
+            arrays = [
+                pa.array(values, pa.string()).cast(field.type)
+                if kind == 'timestamp' else pa.array(values, field.type)
+                for values, field, (_, kind) in zip(zip(*rows), schema, columns)
+            ]
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+            yield _drain(sink)
+    finally:
+        writer.close()
+    
+    yield _drain(sink)
+
+WRITERS = {
+    'csv': _write_csv,
+    'jsonl': _write_jsonl,
+    'parquet': _write_parquet
+}
+
+@instrument_methods('exports')
+class ExportService:
+    def __init__(self):
+        initialize_database()
+    
+    def iter_export(self, table, fmt='csv', chunk_size=None, stats=None):
+        if fmt not in WRITERS:
+            raise ExportError(f"Invalid export format: {fmt}")
+        if table not in EXPORT_TABLES:
+            raise ExportError(f"Invalid export table: {table}")
+        if fmt == 'parquet' and pa is None:
+            raise ExportError("Parquet export requires pyarrow to be installed")
+        
+        chunks = iter_table_chunks(table, chunk_size)
+        if stats is not None:
+            chunks = self._count_rows(chunks, stats)
+        
+        return WRITERS[fmt](EXPORT_TABLES[table], chunks)
+    
+    def _count_rows(self, chunks, stats):
+        stats.setdefault('rows', 0)
+        for rows in chunks:
+            stats['rows'] += len(rows)
+            yield rows
+    
+    def export_to_file(self, table, path, fmt=None, chunk_size=None, max_bytes=None):
+        fmt = fmt or os.path.splitext(path)[1].lstrip('.').lower()
+        result = {
+            'success': False,
+            'table': table,
+            'format': fmt,
+            'path': path,
+            'rows': 0,
+            'bytes': 0,
+            'too_large': False,
+            'error': None
+        }
+        
+        partial_path = f"{path}.part"
+        
+        try:
+            stats = {}
+            chunks = self.iter_export(table, fmt, chunk_size, stats)
+            
+            with open(partial_path, 'wb') as f:
+                for data in chunks:
+                    f.write(data)
+                    result['bytes'] += len(data)
+                    if max_bytes and result['bytes'] > max_bytes:
+                        result['too_large'] = True
+                        raise ExportError(f"Export is larger than {max_bytes} bytes")
+            
+            os.replace(partial_path, path)
+            result['rows'] = stats.get('rows', 0)
+            result['success'] = True
+        
+        except (ExportError, OSError) as e:
+            result['error'] = str(e)
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+        
+        return result
+    
+    def export_to_tempfile(self, table, fmt='csv', chunk_size=None, max_bytes=None):
+        cleanup_temp_exports(get_config().exports.temp_max_age)
+        
+        fd, path = tempfile.mkstemp(prefix=f'{TEMP_PREFIX}{table}_', suffix=f'.{fmt}')
+        os.close(fd)
+        
+        result = self.export_to_file(table, path, fmt, chunk_size, max_bytes)
+        if not result['success'] and os.path.exists(path):
+            os.remove(path)
+        return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Export a stored table to CSV, JSONL or Parquet")
+    parser.add_argument('table', choices=sorted(EXPORT_TABLES))
+    parser.add_argument('-o', '--output', help="Output file, defaults to stdout ('-')", default='-')
+    parser.add_argument('-f', '--format', choices=sorted(EXPORT_FORMATS),
+                        help="Defaults to the output file extension, or csv for stdout")
+    parser.add_argument('--chunk-size', type=int, default=None, help="Rows fetched per round trip")
+    args = parser.parse_args()
+    
+    service = ExportService()
+    
+    if args.output == '-':
+        try:
+            for data in service.iter_export(args.table, args.format or 'csv', args.chunk_size):
+                sys.stdout.buffer.write(data)
+        except ExportError as e:
+            parser.error(str(e))
+        return
+    
+    result = service.export_to_file(args.table, args.output, args.format, args.chunk_size)
+    if not result['success']:
+        parser.error(result['error'])
+    
+    print(f"Exported {result['rows']} {args.table} rows to {result['path']} ({result['bytes']} bytes)",
+          file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
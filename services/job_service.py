@@ -0,0 +1,285 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config import get_config
+from database.db import get_connection, initialize_database
+from services.book_service import BookService
+from services.student_service import StudentService
+from services.user_service import UserService
+from utils.metrics import instrument_methods
+
+ACTIVE_STATUSES = ('queued', 'running')
+JOB_HANDLERS = {}
+JOB_CANCELLABLE = {}
+
+def job_handler(kind, cancellable=False):
+    def register(func):
+        JOB_HANDLERS[kind] = func
+        JOB_CANCELLABLE[kind] = cancellable
+        return func
+    return register
+
+def is_cancellable(kind, params):
+    cancellable = JOB_CANCELLABLE.get(kind, False)
+    return bool(cancellable(params) if callable(cancellable) else cancellable)
+
+@job_handler('fetch_books', cancellable=lambda params: params.get('fetch_all'))
+def run_fetch_books(params, progress):
+    service = BookService()
+    progress(0, message=f"Fetching '{params['query']}'")
+    
+    if params.get('fetch_all'):
+        return service.fetch_and_store_all(
+            params['query'],
+            max_results=params.get('max_results'),
+            progress_callback=lambda fetched, saved: progress(fetched, message=f"Saved {saved} books")
+        )
+    
+    return service.fetch_and_store_books(params['query'], params.get('limit', 10))
+
+@job_handler('generate_students')
+def run_generate_students(params, progress):
+    progress(0, message="Generating student scores")
+    return StudentService().fetch_and_store_data()
+
+@job_handler('import_users', cancellable=True)
+def run_import_users(params, progress):
+    return UserService().import_from_csv_file(
+        params['path'],
+        mode=params.get('mode', 'skip'),
+        progress_callback=lambda total, imported, skipped: progress(
+            total, message=f"{total} rows read, {imported} imported, {skipped} skipped"
+        )
+    )
+
+class JobProgress:
+    def __init__(self, job_id, interval):
+        self.job_id = job_id
+        self.interval = interval
+        self.cancelled = False
+        self.current = 0
+        self.total = None
+        self.message = None
+        self._last_flush = 0.0
+    
+    def __call__(self, current, total=None, message=None):
+        self.current = current
+        if total is not None:
+            self.total = total
+        if message is not None:
+            self.message = message
+        
+        if time.monotonic() - self._last_flush >= self.interval:
+            self.flush()
+        return not self.cancelled
+    
+    def flush(self):
+        self._last_flush = time.monotonic()
+        with get_connection() as conn:
+            conn.execute("""
+                UPDATE jobs
+                SET progress_current = ?, progress_total = ?, message = ?
+                WHERE id = ?
+            """, (self.current, self.total, self.message, self.job_id))
+            conn.commit()
+            row = conn.execute(
+                "SELECT cancel_requested FROM jobs WHERE id = ?", (self.job_id,)
+            ).fetchone()
+        self.cancelled = bool(row and row['cancel_requested'])
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=get_config().jobs.workers, thread_name_prefix='job'
+                )
+    return _executor
+
+_recovered = False
+_recover_lock = threading.Lock()
+
+def recover_interrupted_jobs():
+    global _recovered
+    if _recovered:
+        return 0
+    
+    with _recover_lock:
+        if _recovered:
+            return 0
+        
+        with get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                "SELECT id, params FROM jobs WHERE status IN ('queued', 'running')"
+            ).fetchall()
+            conn.executemany("""
+                UPDATE jobs
+                SET status = 'interrupted', error = 'Interrupted by an application restart',
+                    finished_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, [(row['id'],) for row in rows])
+            conn.commit()
+        
+        for row in rows:
+            params = json.loads(row['params']) if row['params'] else {}
+            if params.get('spooled') and os.path.exists(params['path']):
+                os.unlink(params['path'])
+        
+        _recovered = True
+        return len(rows)
+
+@instrument_methods('jobs')
+class JobService:
+    def __init__(self):
+        initialize_database()
+        recover_interrupted_jobs()
+    
+    def submit(self, kind, params=None):
+        if kind not in JOB_HANDLERS:
+            raise ValueError(f"Unknown job kind: {kind}")
+        
+        params = params or {}
+        with get_connection() as conn:
+            cursor = conn.execute(
+                "INSERT INTO jobs (kind, params) VALUES (?, ?)", (kind, json.dumps(params))
+            )
+            conn.commit()
+            job_id = cursor.lastrowid
+        
+        get_executor().submit(self._run, job_id, kind, params)
+        return job_id
+    
+    def submit_upload(self, file_obj, mode='skip'):
+        spool = tempfile.NamedTemporaryFile(prefix='upload_', suffix='.csv', delete=False)
+        with spool:
+            if hasattr(file_obj, 'seek'):
+                file_obj.seek(0)
+            shutil.copyfileobj(file_obj, spool)
+        
+        return self.submit('import_users', {
+            'path': spool.name,
+            'filename': getattr(file_obj, 'name', None),
+            'mode': mode,
+            'spooled': True
+        })
+    
+    def _run(self, job_id, kind, params):
+        try:
+            self._execute(job_id, kind, params)
+        except Exception as e:
+            self._fail(job_id, str(e))
+        finally:
+            if params.get('spooled') and os.path.exists(params['path']):
+                os.unlink(params['path'])
+    
+    def _execute(self, job_id, kind, params):
+        with get_connection() as conn:
+            cursor = conn.execute("""
+                UPDATE jobs SET status = 'running', started_at = CURRENT_TIMESTAMP
+                WHERE id = ? AND status = 'queued'
+            """, (job_id,))
+            conn.commit()
+            if cursor.rowcount == 0:
+                return
+        
+        progress = JobProgress(job_id, get_config().jobs.progress_interval)
+        
+        try:
+            result = JOB_HANDLERS[kind](params, progress) or {}
+        except Exception as e:
+            self._finish(job_id, 'failed', progress, error=str(e))
+            return
+        
+        if progress.cancelled:
+            status = 'cancelled'
+        elif result.get('success') is False:
+            status = 'failed'
+        else:
+            status = 'succeeded'
+        
+        self._finish(job_id, status, progress, result=result, error=result.get('error'))
+    
+    def _finish(self, job_id, status, progress, result=None, error=None):
+        with get_connection() as conn:
+            conn.execute("""
+                UPDATE jobs
+                SET status = ?, progress_current = ?, progress_total = ?, message = ?,
+                    result = ?, error = ?, finished_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, (
+                status, progress.current, progress.total, progress.message,
+                json.dumps(result, default=str) if result is not None else None,
+                error, job_id
+            ))
+            conn.commit()
+    
+    def _fail(self, job_id, error):
+        with get_connection() as conn:
+            conn.execute("""
+                UPDATE jobs SET status = 'failed', error = ?, finished_at = CURRENT_TIMESTAMP
+                WHERE id = ? AND status IN ('queued', 'running')
+            """, (error, job_id))
+            conn.commit()
+    
+    def cancel(self, job_id):
+        with get_connection() as conn:
+            cursor = conn.execute("""
+                UPDATE jobs SET status = 'cancelled', finished_at = CURRENT_TIMESTAMP
+                WHERE id = ? AND status = 'queued'
+            """, (job_id,))
+            if cursor.rowcount == 0:
+                row = conn.execute("SELECT kind, params FROM jobs WHERE id = ?", (job_id,)).fetchone()
+                if row is None or not is_cancellable(row['kind'], json.loads(row['params'] or '{}')):
+                    conn.commit()
+                    return False
+                cursor = conn.execute(
+                    "UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = 'running'",
+                    (job_id,)
+                )
+            conn.commit()
+            return cursor.rowcount > 0
+    
+    def get_job(self, job_id):
+        with get_connection() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_job(row) if row else None
+    
+    def list_jobs(self, limit=20):
+        with get_connection() as conn:
+            rows = conn.execute(
+                "SELECT * FROM jobs ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [self._to_job(row) for row in rows]
+    
+    def _to_job(self, row):
+        job = dict(row)
+        job['params'] = json.loads(job['params']) if job['params'] else {}
+        job['result'] = json.loads(job['result']) if job['result'] else None
+        job['active'] = job['status'] in ACTIVE_STATUSES
+        job['cancellable'] = job['status'] == 'queued' or (
+            job['status'] == 'running' and is_cancellable(job['kind'], job['params'])
+        )
+        return job
+
+if __name__ == "__main__":
+    print("Testing JobService...")
+    
+    service = JobService()
+    job_id = service.submit('generate_students')
+    
+    while service.get_job(job_id)['active']:
+        time.sleep(0.1)
+    
+    job = service.get_job(job_id)
+    print(f"   Job {job_id}: {job['status']}")
+    print(f"   Result: {job['result']}")
@@ -1,6 +1,18 @@
-from database.db import get_connection, initialize_database
+import math
+import numpy as np
+from database.db import get_connection, initialize_database, mark_table_changed, fetch_page
+from database.bulk import bulk_insert
+from services.analytics import compute_score_analytics, DEFAULT_PERCENTILES
+from config import get_config
 from utils.api_client import generate_mock_student_data
+from utils.metrics import instrument_methods
 
+def _rowid_lookup(rowids):
+    lookup = np.full(max(rowids, default=0) + 1, -1, dtype=np.int32)
+    lookup[rowids] = np.arange(len(rowids), dtype=np.int32)
+    return lookup
+
+@instrument_methods('students')
 class StudentService:
     def __init__(self):
         initialize_database()
@@ -9,27 +21,26 @@ class StudentService:
         data = generate_mock_student_data()
         return data
     
-    def save_student_data(self, students):
-        saved_count = 0
+    def save_student_data(self, students, chunk_size=None):
+        rows = (
+            (
+                student.get('name'),
+                student.get('subject'),
+                student.get('score')
+            )
+            for student in students
+        )
         
         with get_connection() as conn:
-            cursor = conn.cursor()
-            
-            for student in students:
-                try:
-                    cursor.execute("""
-                        INSERT INTO students (name, subject, score)
-                        VALUES (?, ?, ?)
-                    """, (
-                        student.get('name'),
-                        student.get('subject'),
-                        student.get('score')
-                    ))
-                    saved_count += 1
-                except Exception as e:
-                    print(f"Error saving student: {e}")
-            
-            conn.commit()
+            saved_count, failures = bulk_insert(conn, """
+                INSERT INTO students (name, subject, score)
+                VALUES (?, ?, ?)
+            """, rows, chunk_size)
+        
+        mark_table_changed('students')
+        
+        for row, error in failures:
+            print(f"Error saving student: {error}")
         
         return saved_count
     
@@ -45,9 +56,20 @@ class StudentService:
         
         return students
     
+    def get_student_page(self, page_size=None, cursor=None):
+        with get_connection() as conn:
+            return fetch_page(
+                conn, 'students',
+                ['id', 'name', 'subject', 'score', 'created_at'],
+                ['name', 'subject', 'id'],
+                cursor=cursor, page_size=page_size
+            )
+    
     def calculate_average_score(self):
         with get_connection() as conn:
-            cursor = conn.execute("SELECT AVG(score) FROM students")
+            cursor = conn.execute("""
+                SELECT SUM(score_sum) / SUM(record_count) FROM student_subject_stats
+            """)
             avg = cursor.fetchone()[0]
             return round(avg, 2) if avg else 0.0
     
@@ -55,13 +77,14 @@ class StudentService:
         with get_connection() as conn:
             cursor = conn.execute("""
                 SELECT 
-                    COUNT(*) as count,
-                    AVG(score) as average,
-                    MIN(score) as min_score,
-                    MAX(score) as max_score,
-                    COUNT(DISTINCT name) as student_count,
-                    COUNT(DISTINCT subject) as subject_count
-                FROM students
+                    COALESCE(SUM(record_count), 0) as count,
+                    SUM(score_sum) / SUM(record_count) as average,
+                    SUM(score_sum_sq) / SUM(record_count) as mean_square,
+                    MIN(min_score) as min_score,
+                    MAX(max_score) as max_score,
+                    (SELECT COUNT(*) FROM student_name_stats) as student_count,
+                    COUNT(*) as subject_count
+                FROM student_subject_stats
             """)
             
             row = cursor.fetchone()
@@ -69,6 +92,7 @@ class StudentService:
             stats = {
                 'total_records': row['count'],
                 'average_score': round(row['average'], 2) if row['average'] else 0,
+                'std_dev': _std_dev(row['average'], row['mean_square']),
                 'min_score': row['min_score'],
                 'max_score': row['max_score'],
                 'unique_students': row['student_count'],
@@ -80,9 +104,8 @@ class StudentService:
     def get_scores_by_subject(self):
         with get_connection() as conn:
             cursor = conn.execute("""
-                SELECT subject, AVG(score) as avg_score
-                FROM students
-                GROUP BY subject
+                SELECT subject, score_sum / record_count as avg_score
+                FROM student_subject_stats
                 ORDER BY avg_score DESC
             """)
             
@@ -92,9 +115,8 @@ class StudentService:
     def get_scores_by_student(self):
         with get_connection() as conn:
             cursor = conn.execute("""
-                SELECT name, AVG(score) as avg_score
-                FROM students
-                GROUP BY name
+                SELECT name, score_sum / record_count as avg_score
+                FROM student_name_stats
                 ORDER BY avg_score DESC
             """)
             
@@ -104,9 +126,8 @@ class StudentService:
     def get_top_performers(self, limit=5):
         with get_connection() as conn:
             cursor = conn.execute("""
-                SELECT name, AVG(score) as avg_score, COUNT(*) as subjects_taken
-                FROM students
-                GROUP BY name
+                SELECT name, score_sum / record_count as avg_score, record_count as subjects_taken
+                FROM student_name_stats
                 ORDER BY avg_score DESC
                 LIMIT ?
             """, (limit,))
@@ -120,6 +141,119 @@ class StudentService:
                 for row in cursor.fetchall()
             ]
     
+    def get_dashboard_snapshot(self, top_limit=5, page_size=None, cursor=None):
+        with get_connection() as conn:
+            conn.execute("BEGIN")
+            try:
+                subject_rows = conn.execute("""
+                    SELECT
+                        subject,
+                        score_sum / record_count as avg_score,
+                        SUM(record_count) OVER () as count,
+                        SUM(score_sum) OVER () / SUM(record_count) OVER () as average,
+                        SUM(score_sum_sq) OVER () / SUM(record_count) OVER () as mean_square,
+                        MIN(min_score) OVER () as min_score,
+                        MAX(max_score) OVER () as max_score
+                    FROM student_subject_stats
+                    ORDER BY avg_score DESC
+                """).fetchall()
+                
+                student_rows = conn.execute("""
+                    SELECT name, score_sum / record_count as avg_score, record_count as subjects_taken
+                    FROM student_name_stats
+                    ORDER BY avg_score DESC
+                """).fetchall()
+                
+                records = fetch_page(
+                    conn, 'students',
+                    ['id', 'name', 'subject', 'score', 'created_at'],
+                    ['name', 'subject', 'id'],
+                    cursor=cursor, page_size=page_size
+                )
+            finally:
+                conn.rollback()
+        
+        totals = subject_rows[0] if subject_rows else None
+        
+        stats = {
+            'total_records': totals['count'] if totals else 0,
+            'average_score': round(totals['average'], 2) if totals else 0,
+            'std_dev': _std_dev(totals['average'], totals['mean_square']) if totals else 0,
+            'min_score': totals['min_score'] if totals else None,
+            'max_score': totals['max_score'] if totals else None,
+            'unique_students': len(student_rows),
+            'unique_subjects': len(subject_rows)
+        }
+        
+        return {
+            'stats': stats,
+            'by_subject': {row['subject']: round(row['avg_score'], 2) for row in subject_rows},
+            'by_student': {row['name']: round(row['avg_score'], 2) for row in student_rows},
+            'top_performers': [
+                {
+                    'name': row['name'],
+                    'average_score': round(row['avg_score'], 2),
+                    'subjects_taken': row['subjects_taken']
+                }
+                for row in student_rows[:top_limit]
+            ],
+            'records': records
+        }
+    
+    def get_score_analytics(self, bins=10, percentiles=DEFAULT_PERCENTILES):
+        batch_size = get_config().database.batch_size
+        
+        with get_connection() as conn:
+            conn.execute("BEGIN")
+            try:
+                name_rows = conn.execute(
+                    "SELECT rowid, name FROM student_name_stats ORDER BY name"
+                ).fetchall()
+                subject_rows = conn.execute(
+                    "SELECT rowid, subject FROM student_subject_stats ORDER BY subject"
+                ).fetchall()
+                total = conn.execute(
+                    "SELECT COALESCE(SUM(record_count), 0) FROM student_subject_stats"
+                ).fetchone()[0]
+                
+                names = [row[1] for row in name_rows]
+                subjects = [row[1] for row in subject_rows]
+                name_lookup = _rowid_lookup([row[0] for row in name_rows])
+                subject_lookup = _rowid_lookup([row[0] for row in subject_rows])
+                
+                name_codes = np.empty(total, dtype=np.int32)
+                subject_codes = np.empty(total, dtype=np.int32)
+                scores = np.empty(total, dtype=np.float64)
+                
+                cursor = conn.cursor()
+                cursor.row_factory = None
+                cursor.execute("""
+                    SELECT n.rowid, s.rowid, st.score
+                    FROM students st
+                    JOIN student_name_stats n ON n.name = st.name
+                    JOIN student_subject_stats s ON s.subject = st.subject
+                """)
+                offset = 0
+                
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    
+                    end = offset + len(rows)
+                    batch = np.array(rows, dtype=np.float64)
+                    name_codes[offset:end] = name_lookup[batch[:, 0].astype(np.intp)]
+                    subject_codes[offset:end] = subject_lookup[batch[:, 1].astype(np.intp)]
+                    scores[offset:end] = batch[:, 2]
+                    offset = end
+            finally:
+                conn.rollback()
+        
+        return compute_score_analytics(
+            names, subjects, name_codes, subject_codes, scores,
+            bins=bins, percentiles=percentiles
+        )
+    
     def get_chart_data(self):
         return {
             'by_subject': self.get_scores_by_subject(),
@@ -129,14 +263,19 @@ class StudentService:
     
     def clear_students(self):
         with get_connection() as conn:
+            conn.execute("DELETE FROM student_subject_stats")
+            conn.execute("DELETE FROM student_name_stats")
             cursor = conn.execute("DELETE FROM students")
             deleted = cursor.rowcount
             conn.commit()
+            mark_table_changed('students')
             return deleted
     
     def get_student_count(self):
         with get_connection() as conn:
-            cursor = conn.execute("SELECT COUNT(*) FROM students")
+            cursor = conn.execute(
+                "SELECT COALESCE(SUM(record_count), 0) FROM student_subject_stats"
+            )
             return cursor.fetchone()[0]
     
     def fetch_and_store_data(self):
@@ -159,12 +298,17 @@ class StudentService:
             
             result['average_score'] = self.calculate_average_score()
             result['success'] = True
-            
+        
         except Exception as e:
             result['error'] = str(e)
         
         return result
 
+def _std_dev(mean, mean_square):
+    if mean is None or mean_square is None:
+        return 0
+    return round(math.sqrt(max(mean_square - mean * mean, 0.0)), 2)
+
 if __name__ == "__main__":
     print("Testing StudentService...")
     
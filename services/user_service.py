@@ -1,34 +1,30 @@
 from pathlib import Path
-from database.db import get_connection, initialize_database
-from utils.csv_reader import read_csv_file, read_csv_from_bytes, normalize_user_data, CSVError
+from database.db import get_connection, initialize_database, mark_table_changed, fetch_page, build_fts_query
+from database.bulk import bulk_insert, chunked
+from utils.csv_reader import CSVError
+from utils.columnar_csv import iter_user_row_batches
+from utils.parallel_csv import iter_user_batches
+from utils.validation import RejectionReport, validate_user_rows, get_report_dir, MAX_REPORTED_ERRORS
+from config import get_config
+from utils.metrics import instrument_methods
 
+IMPORT_MODES = ('skip', 'merge')
+
+@instrument_methods('users')
 class UserService:
     def __init__(self):
         initialize_database()
     
-    def import_from_csv_file(self, file_path):
-        result = {
-            'success': False,
-            'total_rows': 0,
-            'imported': 0,
-            'skipped': 0,
-            'errors': [],
-            'error': None
-        }
+    def import_from_csv_file(self, file_path, progress_callback=None, chunk_size=None, mode='skip'):
+        result = self._new_import_result()
         
         try:
-            rows = read_csv_file(file_path, required_columns=['name', 'email'])
-            result['total_rows'] = len(rows)
-            
-            users = normalize_user_data(rows)
-            
-            imported, skipped, errors = self._insert_users(users)
-            
-            result['imported'] = imported
-            result['skipped'] = skipped
-            result['errors'] = errors
+            batches = iter_user_row_batches(
+                file_path, required_columns=['name', 'email'], batch_size=chunk_size
+            )
+            self._import_batches(batches, result, progress_callback, chunk_size, mode)
             result['success'] = True
-            
+        
         except CSVError as e:
             result['error'] = f"CSV Error: {e}"
         except FileNotFoundError as e:
@@ -38,67 +34,230 @@ class UserService:
         
         return result
     
-    def import_from_upload(self, file_content, filename="uploaded.csv"):
-        result = {
-            'success': False,
-            'total_rows': 0,
-            'imported': 0,
-            'skipped': 0,
-            'errors': [],
-            'error': None
-        }
+    def import_from_csv_file_parallel(self, file_path, progress_callback=None, chunk_size=None,
+                                      mode='skip', workers=None):
+        result = self._new_import_result()
         
         try:
-            rows = read_csv_from_bytes(file_content, required_columns=['name', 'email'])
-            result['total_rows'] = len(rows)
-            
-            users = normalize_user_data(rows)
-            
-            imported, skipped, errors = self._insert_users(users)
-            
-            result['imported'] = imported
-            result['skipped'] = skipped
-            result['errors'] = errors
+            batches = iter_user_batches(file_path, required_columns=['name', 'email'], workers=workers)
+            self._import_batches(batches, result, progress_callback, chunk_size, mode)
             result['success'] = True
-            
+        
         except CSVError as e:
             result['error'] = f"CSV Error: {e}"
+        except FileNotFoundError as e:
+            result['error'] = f"File not found: {e}"
         except Exception as e:
             result['error'] = f"Unexpected error: {e}"
         
         return result
     
-    def _insert_users(self, users):
-        imported = 0
-        skipped = 0
+    def import_from_upload(self, file_content, filename="uploaded.csv", progress_callback=None,
+                           chunk_size=None, mode='skip'):
+        result = self._new_import_result()
+        
+        try:
+            batches = iter_user_row_batches(
+                file_content, required_columns=['name', 'email'], batch_size=chunk_size
+            )
+            self._import_batches(batches, result, progress_callback, chunk_size, mode)
+            result['success'] = True
+        
+        except CSVError as e:
+            result['error'] = f"CSV Error: {e}"
+        except Exception as e:
+            result['error'] = f"Unexpected error: {e}"
+        
+        return result
+    
+    def save_users(self, users, chunk_size=None, mode='skip'):
+        counts = {'imported': 0, 'updated': 0, 'skipped': 0, 'duplicates': 0, 'existing': 0, 'invalid': 0}
+        chunk_size = chunk_size or get_config().database.batch_size
+        baseline_id = self._max_user_id()
+        
+        for chunk in chunked(users, chunk_size):
+            for key, value in self._insert_users(chunk, chunk_size, mode, baseline_id).items():
+                counts[key] += value
+        
+        return counts
+    
+    def _new_import_result(self):
+        return {
+            'success': False,
+            'total_rows': 0,
+            'imported': 0,
+            'updated': 0,
+            'skipped': 0,
+            'duplicates': 0,
+            'existing': 0,
+            'rejected': 0,
+            'rejection_counts': {},
+            'rejection_report': None,
+            'cancelled': False,
+            'errors': [],
+            'error': None
+        }
+    
+    def _import_batches(self, batches, result, progress_callback=None, chunk_size=None, mode='skip'):
+        if mode not in IMPORT_MODES:
+            raise ValueError(f"Invalid import mode: {mode}")
+        
+        chunk_size = chunk_size or get_config().database.batch_size
+        import_config = get_config().imports
+        row_number = 1
+        baseline_id = self._max_user_id()
+        
+        report = RejectionReport(
+            get_report_dir(import_config.reject_dir), import_config.reject_format,
+            keep=import_config.reject_keep
+        )
+        with report:
+            for row_count, rows in batches:
+                result['total_rows'] += row_count
+                
+                for chunk in chunked(rows, chunk_size):
+                    valid, rejected = validate_user_rows(chunk, row_number)
+                    row_number += len(chunk)
+                    report.write(rejected)
+                    
+                    if valid:
+                        counts = self._insert_user_rows(valid, chunk_size, mode, baseline_id)
+                        
+                        result['imported'] += counts['imported']
+                        result['updated'] += counts['updated']
+                        result['skipped'] += counts['skipped']
+                        result['duplicates'] += counts['duplicates']
+                        result['existing'] += counts['existing']
+                    
+                    if progress_callback and progress_callback(
+                        result['total_rows'], result['imported'], result['skipped']
+                    ) is False:
+                        result['cancelled'] = True
+                        break
+                
+                if result['cancelled']:
+                    break
+        
+        result['rejected'] = report.total
+        result['rejection_counts'] = dict(report.counts)
+        result['rejection_report'] = report.path
+        
         errors = []
+        if result['duplicates']:
+            action = 'merged, last row wins' if mode == 'merge' else 'skipped, first row kept'
+            errors.append(f"{result['duplicates']} duplicate emails in the file {action}")
+        if result['existing']:
+            action = 'updated' if mode == 'merge' else 'skipped'
+            errors.append(f"{result['existing']} emails already in the database {action}")
+        errors.extend(report.summary_lines())
+        errors.extend(report.samples)
         
+        if len(errors) > MAX_REPORTED_ERRORS:
+            hidden = len(errors) - MAX_REPORTED_ERRORS + 1
+            errors = errors[:MAX_REPORTED_ERRORS - 1] + [f"... {hidden} more messages, see the rejection report"]
+        result['errors'] = errors
+    
+    def _max_user_id(self):
         with get_connection() as conn:
-            cursor = conn.cursor()
-            
-            for user in users:
-                try:
-                    cursor.execute("""
-                        INSERT INTO users (name, email, phone)
-                        VALUES (?, ?, ?)
-                    """, (
-                        user.get('name'),
-                        user.get('email'),
-                        user.get('phone', '')
-                    ))
-                    imported += 1
-                    
-                except Exception as e:
-                    if 'UNIQUE constraint' in str(e):
-                        skipped += 1
-                        errors.append(f"Duplicate email: {user.get('email')}")
-                    else:
-                        skipped += 1
-                        errors.append(f"Error for {user.get('email')}: {e}")
-            
-            conn.commit()
+            return conn.execute("SELECT COALESCE(MAX(id), 0) FROM users").fetchone()[0]
+    
+    def _insert_users(self, users, chunk_size=None, mode='skip', baseline_id=None):
+        rows = [
+            (
+                user.get('name'),
+                user.get('email'),
+                user.get('phone', '')
+            )
+            for user in users
+        ]
+        valid, rejected = validate_user_rows(rows)
         
-        return imported, skipped, errors
+        counts = self._insert_user_rows(valid, chunk_size, mode, baseline_id)
+        counts['skipped'] += len(rejected)
+        counts['invalid'] += len(rejected)
+        return counts
+    
+    def _insert_user_rows(self, rows, chunk_size=None, mode='skip', baseline_id=None):
+        if baseline_id is None:
+            baseline_id = self._max_user_id()
+        
+        keep = 'MAX(seq)' if mode == 'merge' else 'MIN(seq)'
+        on_conflict = (
+            "DO UPDATE SET name = excluded.name, phone = excluded.phone"
+            if mode == 'merge' else "DO NOTHING"
+        )
+        
+        with get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("""
+                    CREATE TEMP TABLE IF NOT EXISTS users_staging (
+                        seq INTEGER PRIMARY KEY,
+                        name TEXT,
+                        email TEXT COLLATE NOCASE,
+                        phone TEXT
+                    )
+                """)
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS temp.idx_users_staging_email ON users_staging(email)"
+                )
+                conn.execute("DELETE FROM users_staging")
+                
+                staged, failures = bulk_insert(conn, """
+                    INSERT INTO users_staging (name, email, phone)
+                    VALUES (?, ?, ?)
+                """, rows, chunk_size)
+                
+                row = conn.execute("""
+                    SELECT COUNT(*) AS valid, COUNT(DISTINCT email) AS distinct_emails
+                    FROM users_staging
+                    WHERE name IS NOT NULL AND email IS NOT NULL
+                """).fetchone()
+                valid, distinct_emails = row['valid'], row['distinct_emails']
+                
+                row = conn.execute("""
+                    SELECT COUNT(*) AS matched, COALESCE(SUM(id <= ?), 0) AS existing
+                    FROM users
+                    WHERE email IN (
+                        SELECT email FROM users_staging
+                        WHERE name IS NOT NULL AND email IS NOT NULL
+                    )
+                """, (baseline_id,)).fetchone()
+                matched, existing = row['matched'], row['existing']
+                
+                conn.execute(f"""
+                    INSERT INTO users (name, email, phone)
+                    SELECT name, email, phone
+                    FROM users_staging
+                    WHERE seq IN (
+                        SELECT {keep} FROM users_staging
+                        WHERE name IS NOT NULL AND email IS NOT NULL
+                        GROUP BY email
+                    )
+                    ORDER BY seq
+                    ON CONFLICT(email) {on_conflict}
+                """)
+                
+                conn.execute("DELETE FROM users_staging")
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        
+        mark_table_changed('users')
+        
+        imported = distinct_emails - matched
+        updated = existing if mode == 'merge' else 0
+        invalid = staged - valid + len(failures)
+        
+        return {
+            'imported': imported,
+            'updated': updated,
+            'skipped': staged + len(failures) - imported - updated,
+            'duplicates': valid - distinct_emails + matched - existing,
+            'existing': existing,
+            'invalid': invalid
+        }
     
     def get_all_users(self):
         with get_connection() as conn:
@@ -112,6 +271,15 @@ class UserService:
         
         return users
     
+    def get_users_page(self, page_size=None, cursor=None):
+        with get_connection() as conn:
+            return fetch_page(
+                conn, 'users',
+                ['id', 'name', 'email', 'phone', 'created_at'],
+                ['created_at', 'id'],
+                cursor=cursor, page_size=page_size, descending=True
+            )
+    
     def get_user_by_email(self, email):
         with get_connection() as conn:
             cursor = conn.execute(
@@ -121,14 +289,22 @@ class UserService:
             row = cursor.fetchone()
             return dict(row) if row else None
     
-    def search_users(self, search_term):
+    def search_users(self, search_term, limit=None):
+        match_query = build_fts_query(search_term)
+        if not match_query:
+            return []
+        
+        limit = limit or get_config().database.search_limit
+        
         with get_connection() as conn:
             cursor = conn.execute("""
-                SELECT id, name, email, phone, created_at
-                FROM users
-                WHERE name LIKE ? OR email LIKE ?
-                ORDER BY name
-            """, (f'%{search_term}%', f'%{search_term}%'))
+                SELECT u.id, u.name, u.email, u.phone, u.created_at
+                FROM users_fts
+                JOIN users u ON u.id = users_fts.rowid
+                WHERE users_fts MATCH ?
+                ORDER BY bm25(users_fts)
+                LIMIT ?
+            """, (match_query, limit))
             
             return [dict(row) for row in cursor.fetchall()]
     
@@ -142,12 +318,14 @@ class UserService:
             cursor = conn.execute("DELETE FROM users")
             deleted = cursor.rowcount
             conn.commit()
+            mark_table_changed('users')
             return deleted
     
     def delete_user(self, user_id):
         with get_connection() as conn:
             cursor = conn.execute("DELETE FROM users WHERE id = ?", (user_id,))
             conn.commit()
+            mark_table_changed('users')
             return cursor.rowcount > 0
     
     def get_statistics(self):
@@ -177,7 +355,7 @@ if __name__ == "__main__":
 John Doe,john@example.com,555-1234
 Jane Smith,jane@example.com,555-5678
 Bob Johnson,bob@example.com,"""
-    
+
     test_file = tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False)
     test_file.write(test_csv)
     test_file.close()
@@ -194,6 +372,6 @@ Bob Johnson,bob@example.com,"""
         users = service.get_all_users()
         for user in users:
             print(f"   - {user['name']} ({user['email']})")
-            
+    
     finally:
         os.unlink(test_file.name)
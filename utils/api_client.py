@@ -1,8 +1,25 @@
-import requests
+import json
+import random
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import get_config
+from utils.http_cache import ResponseCache, get_cache_path
+from utils.transport import TransportError, get_transport
+from utils import metrics
 
-DEFAULT_TIMEOUT = 30
-MAX_RETRIES = 3
+DEFAULT_HEADERS = {
+    'Accept': 'application/json',
+    'User-Agent': 'AI-ML-Assignment/1.0'
+}
 
 class APIError(Exception):
     def __init__(self, message, status_code=None):
@@ -10,56 +27,238 @@ class APIError(Exception):
         self.status_code = status_code
         super().__init__(self.message)
 
-def fetch_data(url, params=None, headers=None, timeout=DEFAULT_TIMEOUT):
-    default_headers = {
-        'Accept': 'application/json',
-        'User-Agent': 'AI-ML-Assignment/1.0'
-    }
+class APIClient:
+    def __init__(self, api_config=None, cache=None, transport=None):
+        self.config = api_config or get_config().api
+        self.transport = transport or get_transport(self.config)
+        
+        if cache is None and self.config.cache_enabled:
+            cache = ResponseCache(
+                get_cache_path(self.config.cache_path),
+                ttl=self.config.cache_ttl,
+                max_entries=self.config.cache_max_entries
+            )
+        self.cache = cache
+        
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_maxsize,
+            pool_maxsize=self.config.pool_maxsize
+        )
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update(DEFAULT_HEADERS)
+        
+        self._host_slots = {}
+        self._host_slots_lock = threading.Lock()
     
-    if headers:
-        default_headers.update(headers)
+    def _host_slot(self, url):
+        host = urlsplit(url).netloc
+        with self._host_slots_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.config.per_host_limit)
+            return self._host_slots[host]
     
-    for attempt in range(MAX_RETRIES):
+    def get_json(self, url, params=None, headers=None, timeout=None, use_cache=True):
+        key = None
+        entry = None
+        
+        if self.cache is not None and use_cache:
+            key = self.cache.make_key(url, params)
+            entry = self.cache.get(key)
+            
+            if entry and entry['fresh']:
+                metrics.increment('http_cache_total', result='hit')
+                return json.loads(entry['body'])
+            
+            if entry:
+                headers = dict(headers or {})
+                if entry['etag']:
+                    headers['If-None-Match'] = entry['etag']
+                if entry['last_modified']:
+                    headers['If-Modified-Since'] = entry['last_modified']
+        
+        response = self._send(url, params, headers, timeout)
+        
+        if response.status_code == 304 and entry:
+            metrics.increment('http_cache_total', result='revalidated')
+            self.cache.refresh(key)
+            return json.loads(entry['body'])
+        
+        if key:
+            metrics.increment('http_cache_total', result='miss')
+        
         try:
-            response = requests.get(url, params=params, headers=default_headers, timeout=timeout)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.Timeout:
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(1)
-                continue
-            raise APIError(f"Request timed out after {timeout} seconds")
-        except requests.exceptions.ConnectionError as e:
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(1)
-                continue
-            raise APIError(f"Connection error: {e}")
+            data = response.json()
         except requests.exceptions.HTTPError as e:
             raise APIError(f"HTTP error: {e}", status_code=response.status_code)
         except requests.exceptions.JSONDecodeError:
             raise APIError("Invalid JSON response")
+        
+        if key:
+            self.cache.set(
+                key, url, response.text,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified')
+            )
+        
+        return data
+    
+    def _send(self, url, params, headers, timeout):
+        timeout = timeout or self.config.timeout
+        attempts = max(self.config.max_retries, 1)
+        host = urlsplit(url).netloc
+        
+        for attempt in range(attempts):
+            retries_left = attempt < attempts - 1
+            started = time.perf_counter()
+            
+            try:
+                with self._host_slot(url):
+                    response = self.transport.send(
+                        self.session, url, params=params, headers=headers, timeout=timeout
+                    )
+            except requests.exceptions.Timeout:
+                metrics.observe('http_request_seconds', time.perf_counter() - started,
+                                host=host, status='timeout')
+                if retries_left:
+                    metrics.increment('http_retries_total', host=host, reason='timeout')
+                    time.sleep(self.backoff_delay(attempt))
+                    continue
+                raise APIError(f"Request timed out after {timeout} seconds")
+            except requests.exceptions.ConnectionError as e:
+                metrics.observe('http_request_seconds', time.perf_counter() - started,
+                                host=host, status='connection_error')
+                if retries_left:
+                    metrics.increment('http_retries_total', host=host, reason='connection_error')
+                    time.sleep(self.backoff_delay(attempt))
+                    continue
+                raise APIError(f"Connection error: {e}")
+            except TransportError as e:
+                raise APIError(str(e))
+            
+            metrics.observe('http_request_seconds', time.perf_counter() - started,
+                            host=host, status=str(response.status_code))
+            
+            if response.status_code in self.config.retry_statuses and retries_left:
+                metrics.increment('http_retries_total', host=host, reason=str(response.status_code))
+                time.sleep(self.backoff_delay(attempt, response.headers.get('Retry-After')))
+                continue
+            
+            return response
+    
+    def backoff_delay(self, attempt, retry_after=None):
+        delay = parse_retry_after(retry_after)
+        if delay is None:
+            delay = random.uniform(0, self.config.backoff_factor * (2 ** attempt))
+        return min(delay, self.config.max_backoff)
+    
+    def close(self):
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+
+def parse_retry_after(value):
+    if not value:
+        return None
+    
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_client():
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = APIClient()
+    return _client
+
+def fetch_data(url, params=None, headers=None, timeout=None):
+    return get_client().get_json(url, params=params, headers=headers, timeout=timeout)
+
+BOOK_FIELDS = 'title,author_name,first_publish_year,isbn'
 
 def fetch_books_from_open_library(query="python programming", limit=10):
-    url = "https://openlibrary.org/search.json"
+    url = f"{get_config().api.open_library_base_url}/search.json"
     params = {
         'q': query,
         'limit': limit,
-        'fields': 'title,author_name,first_publish_year,isbn'
+        'fields': BOOK_FIELDS
     }
     
     data = fetch_data(url, params=params)
     
-    books = []
-    for doc in data.get('docs', [])[:limit]:
-        book = {
-            'title': doc.get('title', 'Unknown Title'),
-            'author': doc.get('author_name', ['Unknown Author'])[0] if doc.get('author_name') else 'Unknown Author',
-            'publication_year': doc.get('first_publish_year'),
-            'isbn': doc.get('isbn', [None])[0] if doc.get('isbn') else None
-        }
-        books.append(book)
-    
-    return books
+    return [_parse_book(doc) for doc in data.get('docs', [])[:limit]]
+
+def iter_books_from_open_library(query="python programming", page_size=100, max_results=None, prefetch=2):
+    url = f"{get_config().api.open_library_base_url}/search.json"
+    
+    def fetch_page(offset):
+        return fetch_data(url, params={
+            'q': query,
+            'limit': page_size,
+            'offset': offset,
+            'fields': BOOK_FIELDS
+        })
+    
+    data = fetch_page(0)
+    total = data.get('numFound', 0)
+    if max_results is not None:
+        total = min(total, max_results)
+    
+    step = len(data.get('docs', [])) or page_size
+    yielded = 0
+    next_offset = step
+    pending = deque()
+    
+    with ThreadPoolExecutor(max_workers=max(prefetch, 1)) as executor:
+        while yielded < total:
+            while next_offset < total and len(pending) < prefetch:
+                pending.append((next_offset, executor.submit(fetch_page, next_offset)))
+                next_offset += step
+            
+            docs = data.get('docs', [])
+            if not docs:
+                return
+            
+            for doc in docs[:total - yielded]:
+                yield _parse_book(doc)
+            yielded += min(len(docs), total - yielded)
+            
+            if yielded >= total:
+                return
+            
+            if pending and pending[0][0] == yielded:
+                data = pending.popleft()[1].result()
+            else:
+                for _, future in pending:
+                    future.cancel()
+                pending.clear()
+                data = fetch_page(yielded)
+                next_offset = yielded + step
+
+def _parse_book(doc):
+    return {
+        'title': doc.get('title', 'Unknown Title'),
+        'author': doc.get('author_name', ['Unknown Author'])[0] if doc.get('author_name') else 'Unknown Author',
+        'publication_year': doc.get('first_publish_year'),
+        'isbn': doc.get('isbn', [None])[0] if doc.get('isbn') else None
+    }
 
 def generate_mock_student_data():
     import random
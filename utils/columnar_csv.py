@@ -0,0 +1,207 @@
+import csv
+import io
+import os
+
+from config import get_config
+from database.bulk import chunked
+from utils.csv_reader import (
+    CSVError, MemoryViewReader, check_required_columns, resolve_user_columns, open_binary_buffer
+)
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+ENGINES = ('auto', 'pyarrow', 'pandas', 'csv')
+
+def open_binary_source(source):
+    if isinstance(source, (str, os.PathLike)):
+        try:
+            return open(source, 'rb'), True
+        except FileNotFoundError:
+            raise FileNotFoundError(f"CSV file not found: {source}")
+    if isinstance(source, io.TextIOBase):
+        return io.BytesIO(source.read().encode('utf-8')), True
+    
+    stream = open_binary_buffer(source)
+    return stream, stream is not source
+
+def iter_user_row_batches(source, required_columns=None, delimiter=',', batch_size=None,
+                          engine=None, header=None):
+    batch_size = batch_size or get_config().database.batch_size
+    engine = resolve_engine(engine)
+    
+    stream, owned = open_binary_source(source)
+    try:
+        if header is None:
+            header = read_header(stream, delimiter)
+        check_required_columns(header, required_columns)
+        
+        columns = resolve_user_columns(header)
+        if columns['name'] is None or columns['email'] is None:
+            engine = 'csv'
+        
+        yield from READERS[engine](stream, len(header), columns, batch_size, delimiter)
+    except UnicodeDecodeError as e:
+        raise CSVError(f"Encoding error: {e}")
+    finally:
+        if owned:
+            stream.close()
+
+def resolve_engine(engine=None):
+    engine = engine or get_config().imports.engine
+    if engine not in ENGINES:
+        raise ValueError(f"Invalid CSV engine: {engine}")
+    
+    if engine == 'auto':
+        if pa is not None:
+            return 'pyarrow'
+        return 'pandas' if pd is not None else 'csv'
+    if engine == 'pyarrow' and pa is None:
+        raise CSVError("The pyarrow CSV engine requires pyarrow to be installed")
+    if engine == 'pandas' and pd is None:
+        raise CSVError("The pandas CSV engine requires pandas to be installed")
+    return engine
+
+def read_header(stream, delimiter=','):
+    lines = (line.decode('utf-8') for line in iter(stream.readline, b''))
+    header = next(csv.reader(lines, delimiter=delimiter), None)
+    if not header:
+        raise CSVError("CSV file appears to be empty")
+    return header
+
+def _column_positions(columns):
+    return sorted({index for index in columns.values() if index is not None})
+
+def _arrow_input(stream):
+    if isinstance(stream, io.BufferedReader) and isinstance(stream.raw, MemoryViewReader):
+        return pa.BufferReader(pa.py_buffer(stream.raw.view[stream.tell():]))
+    if isinstance(stream, io.BytesIO):
+        return pa.BufferReader(pa.py_buffer(memoryview(stream.getvalue())[stream.tell():]))
+    if isinstance(stream, io.BufferedReader) and isinstance(getattr(stream, 'name', None), str):
+        arrow_file = pa.OSFile(stream.name)
+        arrow_file.seek(stream.tell())
+        return arrow_file
+    return stream
+
+def _read_pyarrow(stream, width, columns, batch_size, delimiter):
+    names = [str(i) for i in range(width)]
+    include = [str(i) for i in _column_positions(columns)]
+    recovered = {}
+    unnumbered = []
+    
+    def recover_row(row):
+        fields = _row_tuples(csv.reader([row.text], delimiter=delimiter), columns)[0]
+        if row.number is None:
+            unnumbered.append(fields)
+        else:
+            recovered[row.number] = fields
+        return 'skip'
+    
+    def in_file_order(rows, position):
+        for row in rows:
+            while position in recovered:
+                yield recovered.pop(position)
+                position += 1
+            yield row
+            position += 1
+        while position in recovered:
+            yield recovered.pop(position)
+            position += 1
+    
+    emitted = 0
+    pending = []
+    
+    try:
+        reader = pacsv.open_csv(
+            _arrow_input(stream),
+            read_options=pacsv.ReadOptions(column_names=names),
+            parse_options=pacsv.ParseOptions(
+                delimiter=delimiter, newlines_in_values=True, invalid_row_handler=recover_row
+            ),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=include,
+                column_types={name: pa.string() for name in include},
+                strings_can_be_null=False,
+                quoted_strings_can_be_null=False
+            )
+        )
+        
+        for batch in reader:
+            values = [
+                pc.utf8_trim_whitespace(batch.column(str(columns[key]))).to_pylist()
+                if columns[key] is not None else [''] * batch.num_rows
+                for key in ('name', 'email', 'phone')
+            ]
+            rows = list(in_file_order(zip(*values), emitted + len(pending) + 1))
+            rows.extend(unnumbered)
+            unnumbered.clear()
+            
+            pending.extend(rows)
+            while len(pending) >= batch_size:
+                chunk, pending = pending[:batch_size], pending[batch_size:]
+                emitted += len(chunk)
+                yield len(chunk), chunk
+    except pa.ArrowInvalid as e:
+        raise CSVError(f"CSV parse error: {e}")
+    
+    pending.extend(recovered[number] for number in sorted(recovered))
+    pending.extend(unnumbered)
+    for chunk in chunked(pending, batch_size):
+        yield len(chunk), chunk
+
+def _read_pandas(stream, width, columns, batch_size, delimiter):
+    try:
+        reader = pd.read_csv(
+            stream, sep=delimiter, header=None, names=list(range(width)),
+            usecols=_column_positions(columns), dtype=str, na_filter=False, index_col=False,
+            encoding='utf-8', chunksize=batch_size, engine='c'
+        )
+        for frame in reader:
+            values = [
+                frame[columns[key]].str.strip().tolist()
+                if columns[key] is not None else [''] * len(frame)
+                for key in ('name', 'email', 'phone')
+            ]
+            yield len(frame), list(zip(*values))
+    except pd.errors.ParserError as e:
+        raise CSVError(f"CSV parse error: {e}")
+
+def _read_csv(stream, width, columns, batch_size, delimiter):
+    text = io.TextIOWrapper(stream, encoding='utf-8', newline='')
+    try:
+        rows = (row for row in csv.reader(text, delimiter=delimiter) if row)
+        for chunk in chunked(rows, batch_size):
+            if columns['name'] is None or columns['email'] is None:
+                yield len(chunk), []
+            else:
+                yield len(chunk), _row_tuples(chunk, columns)
+    finally:
+        text.detach()
+
+def _row_tuples(rows, columns):
+    name_index, email_index, phone_index = columns['name'], columns['email'], columns['phone']
+    
+    def field(row, index):
+        if index is None or index >= len(row):
+            return ''
+        return row[index].strip()
+    
+    return [
+        (field(row, name_index), field(row, email_index), field(row, phone_index))
+        for row in rows
+    ]
+
+READERS = {
+    'pyarrow': _read_pyarrow,
+    'pandas': _read_pandas,
+    'csv': _read_csv
+}
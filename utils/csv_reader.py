@@ -1,79 +1,143 @@
 import csv
 import io
 
+NAME_COLUMNS = ('name', 'full_name', 'fullname', 'username')
+EMAIL_COLUMNS = ('email', 'email_address', 'e-mail', 'mail')
+PHONE_COLUMNS = ('phone', 'phone_number', 'telephone', 'mobile')
+
 class CSVError(Exception):
     pass
 
 def read_csv_file(file_path, required_columns=None, delimiter=','):
+    return list(iter_csv_file(file_path, required_columns, delimiter))
+
+def iter_csv_file(file_path, required_columns=None, delimiter=','):
     try:
         with open(file_path, 'r', encoding='utf-8', newline='') as f:
-            return _parse_csv(f, required_columns, delimiter)
+            yield from _iter_csv(f, required_columns, delimiter)
     except FileNotFoundError:
         raise FileNotFoundError(f"CSV file not found: {file_path}")
     except UnicodeDecodeError as e:
         raise CSVError(f"Encoding error: {e}")
 
 def read_csv_from_bytes(file_content, required_columns=None, delimiter=','):
-    if isinstance(file_content, bytes):
-        content = file_content.decode('utf-8')
-    else:
-        content = file_content.read()
-        if isinstance(content, bytes):
-            content = content.decode('utf-8')
+    return list(iter_csv_from_bytes(file_content, required_columns, delimiter))
+
+def iter_csv_from_bytes(file_content, required_columns=None, delimiter=','):
+    if isinstance(file_content, io.TextIOBase):
+        yield from _iter_csv(file_content, required_columns, delimiter)
+        return
+    
+    text = io.TextIOWrapper(open_binary_buffer(file_content), encoding='utf-8', newline='')
+    try:
+        yield from _iter_csv(text, required_columns, delimiter)
+    except UnicodeDecodeError as e:
+        raise CSVError(f"Encoding error: {e}")
+    finally:
+        text.detach()
+
+class MemoryViewReader(io.RawIOBase):
+    def __init__(self, buffer):
+        self.view = memoryview(buffer).cast('B')
+        self.position = 0
+    
+    def readable(self):
+        return True
     
-    return _parse_csv(io.StringIO(content), required_columns, delimiter)
+    def seekable(self):
+        return True
+    
+    def readinto(self, b):
+        size = min(len(b), len(self.view) - self.position)
+        b[:size] = self.view[self.position:self.position + size]
+        self.position += size
+        return size
+    
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += len(self.view)
+        self.position = min(max(offset, 0), len(self.view))
+        return self.position
+    
+    def tell(self):
+        return self.position
+    
+    def close(self):
+        if not self.closed:
+            self.view.release()
+        super().close()
+
+def open_binary_buffer(file_content):
+    if isinstance(file_content, (bytes, bytearray, memoryview)):
+        return io.BufferedReader(MemoryViewReader(file_content))
+    
+    if hasattr(file_content, 'seekable') and file_content.seekable():
+        file_content.seek(0)
+    return file_content
 
 def _parse_csv(file_obj, required_columns, delimiter):
-    reader = csv.DictReader(file_obj, delimiter=delimiter)
+    return list(_iter_csv(file_obj, required_columns, delimiter))
+
+def _iter_csv(file_obj, required_columns, delimiter, fieldnames=None):
+    reader = csv.DictReader(file_obj, fieldnames=fieldnames, delimiter=delimiter)
     
     if reader.fieldnames is None:
         raise CSVError("CSV file appears to be empty")
     
-    headers = list(reader.fieldnames)
+    check_required_columns(reader.fieldnames, required_columns)
     
+    for row in reader:
+        yield {
+            key.strip(): (value.strip() if value else '')
+            for key, value in row.items()
+            if key is not None
+        }
+
+def check_required_columns(headers, required_columns):
     if required_columns:
         headers_lower = [h.lower().strip() for h in headers]
         missing = [col for col in required_columns if col.lower() not in headers_lower]
         if missing:
             raise CSVError(f"Missing required columns: {missing}")
+
+def resolve_user_columns(headers):
+    columns = {'name': None, 'email': None, 'phone': None}
     
-    rows = []
-    for row in reader:
-        cleaned_row = {
-            key.strip(): (value.strip() if value else '')
-            for key, value in row.items()
-            if key is not None
-        }
-        rows.append(cleaned_row)
+    for index, header in enumerate(headers):
+        key_lower = header.lower().strip()
+        
+        if key_lower in NAME_COLUMNS and columns['name'] is None:
+            columns['name'] = index
+        elif key_lower in EMAIL_COLUMNS and columns['email'] is None:
+            columns['email'] = index
+        elif key_lower in PHONE_COLUMNS and columns['phone'] is None:
+            columns['phone'] = index
     
-    return rows
+    return columns
 
 def normalize_user_data(rows):
-    normalized = []
-    
-    name_columns = ['name', 'full_name', 'fullname', 'username']
-    email_columns = ['email', 'email_address', 'e-mail', 'mail']
-    phone_columns = ['phone', 'phone_number', 'telephone', 'mobile']
-    
+    return list(iter_normalized_users(rows))
+
+def iter_normalized_users(rows):
     for row in rows:
         user = {}
         
         for key, value in row.items():
             key_lower = key.lower().strip()
             
-            if key_lower in name_columns and 'name' not in user:
+            if key_lower in NAME_COLUMNS and 'name' not in user:
                 user['name'] = value
-            elif key_lower in email_columns and 'email' not in user:
+            elif key_lower in EMAIL_COLUMNS and 'email' not in user:
                 user['email'] = value
-            elif key_lower in phone_columns and 'phone' not in user:
+            elif key_lower in PHONE_COLUMNS and 'phone' not in user:
                 user['phone'] = value
         
         if 'name' in user and 'email' in user:
             if 'phone' not in user:
                 user['phone'] = ''
-            normalized.append(user)
-    
-    return normalized
+            yield user
 
 if __name__ == "__main__":
     import os
@@ -81,7 +145,7 @@ if __name__ == "__main__":
     test_csv = """name,email,phone
 John Doe,john@example.com,555-1234
 Jane Smith,jane@example.com,555-5678"""
-    
+
     test_file = "/tmp/test_users.csv"
     with open(test_file, 'w') as f:
         f.write(test_csv)
@@ -0,0 +1,156 @@
+import argparse
+import time
+
+import numpy as np
+
+DEFAULT_CHUNK_SIZE = 50000
+
+FIRST_NAMES = [
+    "Alice", "Bob", "Charlie", "Diana", "Edward", "Fiona", "George", "Hannah",
+    "Ivan", "Julia", "Kevin", "Laura", "Mohammed", "Nina", "Oscar", "Priya",
+    "Quentin", "Rosa", "Samuel", "Tara", "Umar", "Valeria", "William", "Xin",
+    "Yusuf", "Zoe", "Aarav", "Beatriz", "Chen", "Dmitri", "Elena", "Farah"
+]
+
+LAST_NAMES = [
+    "Johnson", "Smith", "Brown", "Ross", "Chen", "Williams", "Kumar", "Lee",
+    "Petrov", "Martinez", "O'Brien", "Garcia", "Nguyen", "Okafor", "Silva", "Muller",
+    "Rossi", "Tanaka", "Kowalski", "Haddad", "Novak", "Sato", "Andersen", "Costa"
+]
+
+SUBJECTS = [
+    "Mathematics", "Physics", "Chemistry", "Biology", "English",
+    "History", "Geography", "Computer Science"
+]
+
+TITLE_WORDS = [
+    "Python", "Data", "Machine", "Learning", "Deep", "Systems", "Algorithms", "Design",
+    "Patterns", "Networks", "Statistics", "Introduction", "Advanced", "Practical", "Modern", "Guide"
+]
+
+EMAIL_DOMAINS = ["example.com", "example.org", "mail.test", "company.test"]
+
+def _pick(rng, values, size):
+    return np.asarray(values)[rng.integers(0, len(values), size)]
+
+def _full_names(rng, size):
+    return np.char.add(np.char.add(_pick(rng, FIRST_NAMES, size), ' '), _pick(rng, LAST_NAMES, size))
+
+def generate_students(count, seed=None, chunk_size=DEFAULT_CHUNK_SIZE, num_students=None):
+    rng = np.random.default_rng(seed)
+    num_students = num_students or max(count // 4, 1)
+    
+    roster = np.char.add(np.char.add(_full_names(rng, num_students), ' '), np.arange(num_students).astype(str))
+    ability = rng.normal(72, 10, num_students)
+    difficulty = rng.normal(0, 5, len(SUBJECTS))
+    subjects = np.asarray(SUBJECTS)
+    
+    for start in range(0, count, chunk_size):
+        size = min(chunk_size, count - start)
+        student_idx = rng.integers(0, num_students, size)
+        subject_idx = rng.integers(0, len(SUBJECTS), size)
+        scores = ability[student_idx] + difficulty[subject_idx] + rng.normal(0, 8, size)
+        scores = np.clip(scores, 0, 100).round(2)
+        
+        yield [
+            {'name': name, 'subject': subject, 'score': score}
+            for name, subject, score in zip(
+                roster[student_idx].tolist(), subjects[subject_idx].tolist(), scores.tolist()
+            )
+        ]
+
+def generate_users(count, seed=None, chunk_size=DEFAULT_CHUNK_SIZE, phone_rate=0.9):
+    rng = np.random.default_rng(seed)
+    
+    for start in range(0, count, chunk_size):
+        size = min(chunk_size, count - start)
+        first = _pick(rng, FIRST_NAMES, size)
+        last = _pick(rng, LAST_NAMES, size)
+        domains = _pick(rng, EMAIL_DOMAINS, size)
+        ids = np.arange(start, start + size)
+        
+        names = np.char.add(np.char.add(first, ' '), last)
+        local_parts = np.char.lower(np.char.add(np.char.add(first, '.'), np.char.replace(last, "'", '')))
+        emails = np.char.add(
+            np.char.add(np.char.add(local_parts, '.'), ids.astype(str)),
+            np.char.add('@', domains)
+        )
+        phones = np.char.add('555-', np.char.zfill(rng.integers(0, 10000, size).astype(str), 4))
+        phones = np.where(rng.random(size) < phone_rate, phones, '')
+        
+        yield [
+            {'name': name, 'email': email, 'phone': phone}
+            for name, email, phone in zip(names.tolist(), emails.tolist(), phones.tolist())
+        ]
+
+def generate_books(count, seed=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    rng = np.random.default_rng(seed)
+    
+    for start in range(0, count, chunk_size):
+        size = min(chunk_size, count - start)
+        ids = np.arange(start, start + size)
+        
+        titles = np.char.add(
+            np.char.add(np.char.add(_pick(rng, TITLE_WORDS, size), ' '), _pick(rng, TITLE_WORDS, size)),
+            np.char.add(' Vol. ', ids.astype(str))
+        )
+        authors = _full_names(rng, size)
+        years = rng.integers(1950, 2026, size)
+        isbns = np.char.add('978', np.char.zfill(rng.integers(0, 10 ** 10, size).astype(str), 10))
+        
+        yield [
+            {'title': title, 'author': author, 'publication_year': year, 'isbn': isbn}
+            for title, author, year, isbn in zip(
+                titles.tolist(), authors.tolist(), years.tolist(), isbns.tolist()
+            )
+        ]
+
+GENERATORS = {
+    'students': generate_students,
+    'users': generate_users,
+    'books': generate_books
+}
+
+def seed_database(table, count, seed=None, chunk_size=DEFAULT_CHUNK_SIZE, progress_callback=None):
+    from services.book_service import BookService
+    from services.student_service import StudentService
+    from services.user_service import UserService
+    
+    if table not in GENERATORS:
+        raise ValueError(f"Invalid table name: {table}")
+    
+    save = {
+        'students': lambda chunk: StudentService().save_student_data(chunk, chunk_size),
+        'users': lambda chunk: UserService().save_users(chunk, chunk_size)['imported'],
+        'books': lambda chunk: BookService().save_books_to_db(chunk, chunk_size)
+    }[table]
+    
+    generated = 0
+    saved = 0
+    
+    for chunk in GENERATORS[table](count, seed=seed, chunk_size=chunk_size):
+        generated += len(chunk)
+        saved += save(chunk)
+        
+        if progress_callback:
+            progress_callback(generated, saved)
+    
+    return {'generated': generated, 'saved': saved}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load seeded synthetic data into the database")
+    parser.add_argument('table', choices=sorted(GENERATORS))
+    parser.add_argument('count', type=int)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+    
+    started = time.perf_counter()
+    result = seed_database(
+        args.table, args.count, seed=args.seed, chunk_size=args.chunk_size,
+        progress_callback=lambda generated, saved: print(f"  {generated} generated, {saved} saved")
+    )
+    elapsed = time.perf_counter() - started
+    
+    print(f"Loaded {result['saved']} of {result['generated']} {args.table} rows in {elapsed:.1f}s "
+          f"({result['generated'] / elapsed:.0f} rows/s)")
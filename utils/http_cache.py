@@ -0,0 +1,115 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlencode, urlsplit, urlunsplit
+
+class ResponseCache:
+    def __init__(self, path, ttl=3600, max_entries=1000):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS http_cache (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                body TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_http_cache_accessed_at ON http_cache(accessed_at)"
+        )
+        self.conn.commit()
+    
+    @staticmethod
+    def make_key(url, params=None):
+        parts = urlsplit(url)
+        normalized_url = urlunsplit((
+            parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', parts.query, ''
+        ))
+        query = urlencode(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        return hashlib.sha256(f"{normalized_url}?{query}".encode('utf-8')).hexdigest()
+    
+    def get(self, key):
+        now = time.time()
+        
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT body, etag, last_modified, expires_at FROM http_cache WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            self.conn.execute("UPDATE http_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self.conn.commit()
+        
+        return {
+            'body': row['body'],
+            'etag': row['etag'],
+            'last_modified': row['last_modified'],
+            'fresh': row['expires_at'] > now
+        }
+    
+    def set(self, key, url, body, etag=None, last_modified=None):
+        now = time.time()
+        
+        with self._lock:
+            self.conn.execute("""
+                INSERT INTO http_cache (key, url, body, etag, last_modified, expires_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    url = excluded.url,
+                    body = excluded.body,
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    expires_at = excluded.expires_at,
+                    accessed_at = excluded.accessed_at
+            """, (key, url, body, etag, last_modified, now + self.ttl, now))
+            self._evict()
+            self.conn.commit()
+    
+    def refresh(self, key):
+        now = time.time()
+        
+        with self._lock:
+            self.conn.execute(
+                "UPDATE http_cache SET expires_at = ?, accessed_at = ? WHERE key = ?",
+                (now + self.ttl, now, key)
+            )
+            self.conn.commit()
+    
+    def _evict(self):
+        count = self.conn.execute("SELECT COUNT(*) FROM http_cache").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self.conn.execute("""
+                DELETE FROM http_cache WHERE key IN (
+                    SELECT key FROM http_cache ORDER BY accessed_at LIMIT ?
+                )
+            """, (excess,))
+    
+    def clear(self):
+        with self._lock:
+            cursor = self.conn.execute("DELETE FROM http_cache")
+            self.conn.commit()
+            return cursor.rowcount
+    
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+def get_cache_path(path):
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, path)
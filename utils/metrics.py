@@ -0,0 +1,185 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+
+from config import get_config
+
+DEFAULT_BUCKETS = (
+    0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+
+class Histogram:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+    
+    def observe(self, value):
+        self.bucket_counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+    
+    def quantile(self, q):
+        if not self.count:
+            return None
+        
+        target = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.bucket_counts):
+            if seen + bucket_count >= target and bucket_count:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.buckets[-1]
+                estimate = lower + (upper - lower) * (target - seen) / bucket_count
+                return min(max(estimate, self.min), self.max)
+            seen += bucket_count
+        return self.max
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._counters = {}
+    
+    def observe(self, name, value, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(value)
+    
+    def increment(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+    
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+    
+    def summary(self):
+        with self._lock:
+            histograms = list(self._histograms.items())
+            counters = list(self._counters.items())
+        
+        rows = []
+        for (name, labels), histogram in sorted(histograms):
+            rows.append({
+                'metric': name,
+                'labels': ', '.join(f"{k}={v}" for k, v in labels),
+                'count': histogram.count,
+                'total_ms': round(histogram.sum * 1000, 2),
+                'p50_ms': round(histogram.quantile(0.5) * 1000, 3),
+                'p99_ms': round(histogram.quantile(0.99) * 1000, 3)
+            })
+        for (name, labels), value in sorted(counters):
+            rows.append({
+                'metric': name,
+                'labels': ', '.join(f"{k}={v}" for k, v in labels),
+                'count': value,
+                'total_ms': None,
+                'p50_ms': None,
+                'p99_ms': None
+            })
+        return rows
+    
+    def render_prometheus(self):
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = sorted(self._counters.items())
+        
+        lines = []
+        declared = set()
+        
+        for (name, labels), histogram in histograms:
+            if name not in declared:
+                lines.append(f"# TYPE {name} histogram")
+                declared.add(name)
+            
+            cumulative = 0
+            for bound, bucket_count in zip(histogram.buckets, histogram.bucket_counts):
+                cumulative += bucket_count
+                lines.append(f"{name}_bucket{_format_labels(labels, le=repr(bound))} {cumulative}")
+            lines.append(f"{name}_bucket{_format_labels(labels, le='+Inf')} {histogram.count}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {histogram.sum}")
+            lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+        
+        for (name, labels), value in counters:
+            if name not in declared:
+                lines.append(f"# TYPE {name} counter")
+                declared.add(name)
+            lines.append(f"{name}{_format_labels(labels)} {value}")
+        
+        return '\n'.join(lines) + '\n'
+
+def _format_labels(labels, **extra):
+    pairs = list(labels) + list(extra.items())
+    if not pairs:
+        return ''
+    
+    def escape(value):
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    
+    return '{' + ','.join(f'{key}="{escape(value)}"' for key, value in pairs) + '}'
+
+registry = MetricsRegistry()
+
+def get_registry():
+    return registry
+
+def metrics_enabled():
+    return get_config().metrics_enabled
+
+def observe(name, value, **labels):
+    if metrics_enabled():
+        registry.observe(name, value, **labels)
+
+def increment(name, amount=1, **labels):
+    if metrics_enabled():
+        registry.increment(name, amount, **labels)
+
+@contextmanager
+def timed(name, **labels):
+    if not metrics_enabled():
+        yield
+        return
+    
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        registry.observe(name, time.perf_counter() - started, **labels)
+
+def instrument_methods(prefix):
+    def decorate(cls):
+        for attr, method in list(vars(cls).items()):
+            if attr.startswith('_') or not callable(method):
+                continue
+            setattr(cls, attr, _span(f"{prefix}.{attr}", method))
+        return cls
+    return decorate
+
+def _span(name, method):
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        if not metrics_enabled():
+            return method(*args, **kwargs)
+        
+        started = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            registry.observe('service_method_seconds', time.perf_counter() - started, method=name)
+    return wrapper
+
+def statement_label(sql):
+    return ' '.join(sql.split())[:120]
@@ -0,0 +1,164 @@
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+AUTHORS = [
+    "Ada Lovelace", "Alan Turing", "Grace Hopper", "Donald Knuth", "Barbara Liskov",
+    "Edsger Dijkstra", "Margaret Hamilton", "Guido van Rossum", "Frances Allen", "Ken Thompson"
+]
+
+@dataclass
+class StubSettings:
+    num_found: int = 1000
+    page_size: int = 100
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    retry_after: float = 0.0
+    seed: int = 42
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    
+    def __init__(self, address, settings):
+        super().__init__(address, StubHandler)
+        self.settings = settings
+        self.random = random.Random(settings.seed)
+        self.lock = threading.Lock()
+        self.stats = {'requests': 0, 'errors': 0, 'not_modified': 0}
+    
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def count(self, key):
+        with self.lock:
+            self.stats[key] += 1
+    
+    def draw(self):
+        with self.lock:
+            return self.random.random()
+
+class StubHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+    
+    def do_GET(self):
+        settings = self.server.settings
+        self.server.count('requests')
+        
+        parts = urlsplit(self.path)
+        if parts.path != '/search.json':
+            self._send_json(404, {'error': 'Not found'})
+            return
+        
+        delay = settings.latency + settings.jitter * self.server.draw()
+        if delay > 0:
+            time.sleep(delay)
+        
+        if settings.error_rate and self.server.draw() < settings.error_rate:
+            self.server.count('errors')
+            headers = {'Retry-After': str(settings.retry_after)} if settings.retry_after > 0 else None
+            self._send_json(settings.error_status, {'error': 'Injected failure'}, headers)
+            return
+        
+        query = parse_qs(parts.query)
+        q = query.get('q', [''])[0]
+        try:
+            limit = min(int(query.get('limit', [settings.page_size])[0]), settings.page_size)
+            page = max(int(query.get('page', [1])[0]), 1)
+            start = max(int(query.get('offset', [(page - 1) * limit])[0]), 0)
+        except ValueError:
+            self._send_json(400, {'error': 'Invalid limit, page or offset'})
+            return
+        
+        end = min(start + limit, settings.num_found)
+        body = build_search_response(q, start, end, settings.num_found)
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        
+        if self.headers.get('If-None-Match') == etag:
+            self.server.count('not_modified')
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        
+        self._send_body(200, body, {'ETag': etag})
+    
+    def _send_json(self, status, payload, headers=None):
+        self._send_body(status, json.dumps(payload).encode('utf-8'), headers)
+    
+    def _send_body(self, status, body, headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+def build_search_response(query, start, end, num_found):
+    label = query.title() or "Untitled"
+    docs = [
+        {
+            'title': f"{label} Volume {i + 1}",
+            'author_name': [AUTHORS[i % len(AUTHORS)]],
+            'first_publish_year': 1950 + i % 75,
+            'isbn': [f"978{i:010d}"]
+        }
+        for i in range(start, max(end, start))
+    ]
+    return json.dumps({'numFound': num_found, 'start': start, 'docs': docs}).encode('utf-8')
+
+def start_stub_server(settings=None, host='127.0.0.1', port=0):
+    server = StubServer((host, port), settings or StubSettings())
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Open Library search API")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--num-found', type=int, default=StubSettings.num_found)
+    parser.add_argument('--page-size', type=int, default=StubSettings.page_size)
+    parser.add_argument('--latency', type=float, default=0.0, help="Base delay per request in seconds")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Extra random delay up to this many seconds")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests that fail")
+    parser.add_argument('--error-status', type=int, default=StubSettings.error_status)
+    parser.add_argument('--retry-after', type=float, default=0.0,
+                        help="Retry-After seconds on injected errors, omitted when 0")
+    parser.add_argument('--seed', type=int, default=StubSettings.seed)
+    args = parser.parse_args()
+    
+    settings = StubSettings(
+        num_found=args.num_found,
+        page_size=args.page_size,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        retry_after=args.retry_after,
+        seed=args.seed
+    )
+    server = StubServer((args.host, args.port), settings)
+    
+    print(f"Serving Open Library stub on {server.base_url}")
+    print(f"Run the app with OPEN_LIBRARY_BASE_URL={server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Stats: {server.stats}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+import csv
+import io
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from config import get_config
+from utils.csv_reader import CSVError, check_required_columns
+from utils.columnar_csv import iter_user_row_batches
+
+SCAN_BLOCK_SIZE = 1024 * 1024
+
+def find_record_boundaries(file_path, chunk_bytes, block_size=SCAN_BLOCK_SIZE):
+    boundaries = []
+    target = 0
+    position = 0
+    quotes = 0
+    
+    with open(file_path, 'rb') as f:
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            
+            search_from = max(target - position, 0)
+            while search_from < len(block):
+                newline = block.find(b'\n', search_from)
+                if newline == -1:
+                    break
+                
+                if (quotes + block.count(b'"', 0, newline)) % 2 == 0:
+                    boundary = position + newline + 1
+                    boundaries.append(boundary)
+                    target = boundary + chunk_bytes
+                    search_from = target - position
+                else:
+                    search_from = newline + 1
+            
+            quotes += block.count(b'"')
+            position += len(block)
+    
+    return boundaries, position
+
+def split_csv_file(file_path, chunk_bytes):
+    boundaries, size = find_record_boundaries(file_path, chunk_bytes)
+    header_end = boundaries[0] if boundaries else size
+    
+    offsets = [header_end] + [b for b in boundaries[1:] if b < size] + [size]
+    ranges = [(start, end) for start, end in zip(offsets, offsets[1:]) if end > start]
+    return header_end, ranges
+
+def read_header(file_path, header_end, delimiter=','):
+    with open(file_path, 'rb') as f:
+        raw = f.read(header_end)
+    
+    try:
+        text = raw.decode('utf-8')
+    except UnicodeDecodeError as e:
+        raise CSVError(f"Encoding error: {e}")
+    
+    header = next(csv.reader(io.StringIO(text), delimiter=delimiter), None)
+    if not header:
+        raise CSVError("CSV file appears to be empty")
+    return header
+
+def parse_range(file_path, start, end, fieldnames, delimiter=','):
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        raw = f.read(end - start)
+    
+    row_count = 0
+    rows = []
+    for count, batch in iter_user_row_batches(raw, delimiter=delimiter, header=fieldnames):
+        row_count += count
+        rows.extend(batch)
+    return row_count, rows
+
+def iter_user_batches(file_path, required_columns=None, delimiter=',', workers=None, chunk_bytes=None):
+    import_config = get_config().imports
+    workers = workers or import_config.workers
+    chunk_bytes = chunk_bytes or import_config.chunk_bytes
+    
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"CSV file not found: {file_path}")
+    
+    header_end, ranges = split_csv_file(file_path, chunk_bytes)
+    fieldnames = read_header(file_path, header_end, delimiter)
+    check_required_columns(fieldnames, required_columns)
+    
+    if workers <= 1 or len(ranges) <= 1:
+        for start, end in ranges:
+            yield parse_range(file_path, start, end, fieldnames, delimiter)
+        return
+    
+    context = multiprocessing.get_context('spawn')
+    pending = deque()
+    remaining = iter(ranges)
+    
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges)), mp_context=context) as executor:
+        try:
+            while True:
+                for start, end in remaining:
+                    pending.append(executor.submit(parse_range, file_path, start, end, fieldnames, delimiter))
+                    if len(pending) >= workers * 2:
+                        break
+                
+                if not pending:
+                    return
+                
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,101 @@
+import json
+import os
+import tempfile
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from utils.http_cache import ResponseCache, get_cache_path
+
+TRANSPORT_MODES = ('live', 'record', 'replay')
+RECORDED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Retry-After')
+
+class TransportError(Exception):
+    pass
+
+class LiveTransport:
+    def send(self, session, url, params=None, headers=None, timeout=None):
+        return session.get(url, params=params, headers=headers, timeout=timeout)
+
+class FixtureStore:
+    def __init__(self, directory):
+        self.directory = directory
+    
+    def path_for(self, url, params=None):
+        key = ResponseCache.make_key(f"fixture://{urlsplit(url).path}", params)
+        return os.path.join(self.directory, f"{key}.json")
+    
+    def load(self, url, params=None):
+        path = self.path_for(url, params)
+        try:
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+    
+    def save(self, url, params, response):
+        os.makedirs(self.directory, exist_ok=True)
+        fixture = {
+            'url': url,
+            'params': {str(k): str(v) for k, v in (params or {}).items()},
+            'status_code': response.status_code,
+            'headers': {
+                name: response.headers[name]
+                for name in RECORDED_HEADERS if name in response.headers
+            },
+            'body': response.text
+        }
+        
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(fixture, f, indent=2)
+            os.replace(tmp_path, self.path_for(url, params))
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+class RecordingTransport:
+    def __init__(self, store, inner=None):
+        self.store = store
+        self.inner = inner or LiveTransport()
+    
+    def send(self, session, url, params=None, headers=None, timeout=None):
+        response = self.inner.send(session, url, params=params, headers=headers, timeout=timeout)
+        if response.status_code != 304:
+            self.store.save(url, params, response)
+        return response
+
+class ReplayTransport:
+    def __init__(self, store):
+        self.store = store
+    
+    def send(self, session, url, params=None, headers=None, timeout=None):
+        fixture = self.store.load(url, params)
+        if fixture is None:
+            raise TransportError(
+                f"No recorded fixture for {url} with params {params or {}} "
+                f"in {self.store.directory}"
+            )
+        
+        response = requests.Response()
+        response.status_code = fixture['status_code']
+        response.headers = CaseInsensitiveDict(fixture.get('headers', {}))
+        response._content = fixture['body'].encode('utf-8')
+        response.encoding = 'utf-8'
+        response.url = url
+        return response
+
+def get_transport(api_config):
+    mode = api_config.transport
+    if mode not in TRANSPORT_MODES:
+        raise ValueError(f"Invalid API transport: {mode}")
+    
+    if mode == 'live':
+        return LiveTransport()
+    
+    store = FixtureStore(get_cache_path(api_config.fixtures_dir))
+    if mode == 'record':
+        return RecordingTransport(store)
+    return ReplayTransport(store)
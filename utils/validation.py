@@ -0,0 +1,206 @@
+import csv
+import json
+import os
+import re
+import uuid
+from datetime import datetime
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+EMAIL_PATTERN = re.compile(r"[^@\s]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)+")
+PHONE_NOISE = re.compile(r"[\s().\-/]")
+PHONE_PATTERN = re.compile(r"\+?[0-9]{7,15}")
+WHITESPACE = re.compile(r"\s+")
+
+# RE2 spells out the characters Python's str patterns treat as \s
+ARROW_SPACE = r"\t\n\x0b\f\r\x1c-\x1f\x85\p{Z}"
+ARROW_EMAIL_PATTERN = rf"^[^@{ARROW_SPACE}]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)+$"
+ARROW_PHONE_NOISE = rf"[{ARROW_SPACE}().\-/]"
+ARROW_PHONE_PATTERN = r"^\+?[0-9]{7,15}$"
+ARROW_WHITESPACE = rf"[{ARROW_SPACE}]+"
+VECTORIZE_MIN_ROWS = 64
+
+REJECTION_REASONS = {
+    'missing_name': "missing name",
+    'missing_email': "missing email",
+    'invalid_email': "invalid email",
+    'invalid_phone': "invalid phone"
+}
+REPORT_FORMATS = ('csv', 'jsonl')
+MAX_REPORTED_ERRORS = 10
+REPORT_FIELDS = ['row', 'reason', 'name', 'email', 'phone']
+
+def normalize_phone(phone):
+    if not phone:
+        return ''
+    phone = PHONE_NOISE.sub('', phone)
+    return phone if PHONE_PATTERN.fullmatch(phone) else None
+
+def validate_user_rows(rows, start_row=1):
+    if pa is not None and len(rows) >= VECTORIZE_MIN_ROWS:
+        return _validate_columns(rows, start_row)
+    return _validate_rows(rows, start_row)
+
+def _validate_columns(rows, start_row):
+    names, emails, phones = (pa.array(column, pa.string()) for column in zip(*rows))
+    
+    names = pc.utf8_trim_whitespace(
+        pc.replace_substring_regex(pc.fill_null(names, ''), ARROW_WHITESPACE, ' ')
+    )
+    emails = pc.utf8_lower(pc.utf8_trim_whitespace(pc.fill_null(emails, '')))
+    stripped_phones = pc.utf8_trim_whitespace(pc.fill_null(phones, ''))
+    clean_phones = pc.replace_substring_regex(stripped_phones, ARROW_PHONE_NOISE, '')
+    no_phone = pc.equal(stripped_phones, '')
+    
+    reasons = pc.case_when(
+        pc.make_struct(
+            pc.equal(names, ''),
+            pc.equal(emails, ''),
+            pc.invert(pc.match_substring_regex(emails, ARROW_EMAIL_PATTERN)),
+            pc.invert(pc.or_(no_phone, pc.match_substring_regex(clean_phones, ARROW_PHONE_PATTERN)))
+        ),
+        'missing_name', 'missing_email', 'invalid_email', 'invalid_phone'
+    )
+    is_valid = pc.is_null(reasons)
+    canonical_phones = pc.if_else(no_phone, '', clean_phones)
+    
+    valid = list(zip(
+        names.filter(is_valid).to_pylist(),
+        emails.filter(is_valid).to_pylist(),
+        canonical_phones.filter(is_valid).to_pylist()
+    ))
+    
+    rejected = []
+    positions = pc.indices_nonzero(pc.invert(is_valid))
+    if len(positions):
+        rejected = list(zip(
+            [start_row + position for position in positions.to_pylist()],
+            reasons.take(positions).to_pylist(),
+            names.take(positions).to_pylist(),
+            emails.take(positions).to_pylist(),
+            phones.take(positions).to_pylist()
+        ))
+    
+    return valid, rejected
+
+def _validate_rows(rows, start_row):
+    valid = []
+    rejected = []
+    collapse = WHITESPACE.sub
+    email_match = EMAIL_PATTERN.fullmatch
+    
+    for row_number, (name, email, phone) in enumerate(rows, start_row):
+        name = collapse(' ', name).strip() if name else ''
+        email = email.strip().lower() if email else ''
+        canonical_phone = normalize_phone(phone.strip() if phone else '')
+        
+        if not name:
+            reason = 'missing_name'
+        elif not email:
+            reason = 'missing_email'
+        elif not email_match(email):
+            reason = 'invalid_email'
+        elif canonical_phone is None:
+            reason = 'invalid_phone'
+        else:
+            valid.append((name, email, canonical_phone))
+            continue
+        
+        rejected.append((row_number, reason, name, email, phone))
+    
+    return valid, rejected
+
+def get_report_dir(directory):
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, directory)
+
+class RejectionReport:
+    def __init__(self, directory, fmt='csv', prefix='users_rejected', max_samples=MAX_REPORTED_ERRORS,
+                 keep=None):
+        if fmt not in REPORT_FORMATS:
+            raise ValueError(f"Invalid rejection report format: {fmt}")
+        
+        self.directory = directory
+        self.format = fmt
+        self.prefix = prefix
+        self.path = None
+        self.total = 0
+        self.counts = {}
+        self.samples = []
+        self.max_samples = max_samples
+        self.keep = keep
+        self._file = None
+        self._writer = None
+    
+    def write(self, rejected):
+        if not rejected:
+            return
+        
+        if self._file is None:
+            self._open()
+        
+        for row in rejected:
+            self.counts[row[1]] = self.counts.get(row[1], 0) + 1
+            
+            if len(self.samples) < self.max_samples:
+                row_number, reason, name, email, phone = row
+                self.samples.append(
+                    f"Row {row_number}: {REJECTION_REASONS.get(reason, reason)} "
+                    f"(name={name!r}, email={email!r}, phone={phone!r})"
+                )
+            
+            if self.format == 'csv':
+                self._writer.writerow(row)
+            else:
+                self._file.write(json.dumps(dict(zip(REPORT_FIELDS, row))) + '\n')
+        
+        self.total += len(rejected)
+    
+    def _open(self):
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.path = os.path.join(
+            self.directory, f"{self.prefix}_{stamp}_{uuid.uuid4().hex[:8]}.{self.format}"
+        )
+        self._file = open(self.path, 'w', encoding='utf-8', newline='')
+        
+        if self.format == 'csv':
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(REPORT_FIELDS)
+        
+        if self.keep is not None:
+            self._prune()
+    
+    def _prune(self):
+        reports = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.startswith(f"{self.prefix}_") and entry.path != self.path:
+                reports.append((entry.stat().st_mtime, entry.path))
+        
+        reports.sort(reverse=True)
+        for _, path in reports[max(self.keep - 1, 0):]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+    
+    def summary_lines(self):
+        return [
+            f"{count} rows rejected: {REJECTION_REASONS.get(reason, reason)}"
+            for reason, count in sorted(self.counts.items(), key=lambda item: -item[1])
+        ]
+    
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()